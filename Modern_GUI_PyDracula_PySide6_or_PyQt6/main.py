@@ -17,6 +17,7 @@
 import sys
 import os
 import platform
+import logging
 from PySide6.QtWidgets import QMessageBox
 import scrape_images
 
@@ -30,6 +31,15 @@ os.environ["QT_FONT_DPI"] = "96" # FIX Problem for High DPI and Scale above 100%
 # ///////////////////////////////////////////////////////////////
 widgets = None
 
+# Scrapes run at the same time, and Chrome instances they share: scrapes served
+# by the Shopify JSON or plain HTTP never wait for a browser
+MAX_SCRAPES = int(os.environ.get("GUI_MAX_SCRAPES", "4"))
+BROWSERS = int(os.environ.get("GUI_BROWSERS", "2"))
+
+# Time given to running scrapes when the window closes, before their browsers
+# are quit under them (ms)
+SHUTDOWN_TIMEOUT = 3000
+
 class MainWindow(QMainWindow):
     def __init__(self):
         QMainWindow.__init__(self)
@@ -42,7 +52,7 @@ class MainWindow(QMainWindow):
         widgets = self.ui
         # —— Renommage des boutons ——
         widgets.btn_home.setText("À venir")
-        widgets.btn_widgets.setText("À venir")
+        widgets.btn_widgets.setText("Suivi")
         widgets.btn_new.setText("Scraping Image")
         widgets.btn_save.setText("Paramètres")
 
@@ -52,6 +62,36 @@ class MainWindow(QMainWindow):
         widgets.btn_launch_scraping.clicked.connect(self.run_scraper)
         widgets.btn_reset_fields.clicked.connect(self.reset_fields)
 
+        # Navigateurs Chrome gardés ouverts d'un scraping à l'autre
+        self.driver_pool = scrape_images.DriverPool(BROWSERS)
+
+        # Scrapings lancés en arrière-plan (la fenêtre reste fluide), au plus
+        # MAX_SCRAPES à la fois : les suivants attendent leur tour, et ceux qui
+        # ont besoin de Chrome attendent un navigateur libre du pool
+        self.scrape_pool = QThreadPool(self)
+        self.scrape_pool.setMaxThreadCount(max(1, MAX_SCRAPES))
+        self.closing = False
+        self.scrape_workers = []
+        self.job_ids = {}
+        self.next_job_id = 0
+        self.images_processed = 0
+        widgets.btn_cancel_scraping = QPushButton(widgets.new_page)
+        widgets.btn_cancel_scraping.setObjectName(u"btn_cancel_scraping")
+        widgets.btn_cancel_scraping.setText("\u23f9 Annuler")
+        widgets.btn_cancel_scraping.setEnabled(False)
+        widgets.buttons_layout.addWidget(widgets.btn_cancel_scraping)
+        widgets.btn_cancel_scraping.clicked.connect(self.cancel_scraping)
+        widgets.label_progress = QLabel(widgets.new_page)
+        widgets.buttons_layout.addWidget(widgets.label_progress)
+
+        # Logs des scrapings : écrits par lots dans log_browser
+        self.log_sink = LogSink(widgets.log_browser)
+        self.log_sink.setFormatter(logging.Formatter("%(message)s"))
+        self.scrape_logger = logging.getLogger("ScrapingLogger")
+        self.scrape_logger.setLevel(logging.INFO)
+        self.scrape_logger.propagate = False
+        self.scrape_logger.handlers[:] = [self.log_sink]
+
         # USE CUSTOM TITLE BAR | USE AS "False" FOR MAC OR LINUX
         # ///////////////////////////////////////////////////////////////
         Settings.ENABLE_CUSTOM_TITLE_BAR = True
@@ -72,9 +112,20 @@ class MainWindow(QMainWindow):
         # ///////////////////////////////////////////////////////////////
         UIFunctions.uiDefinitions(self)
 
-        # QTableWidget PARAMETERS
+        # JOBS DASHBOARD (replaces the demo tableWidget)
         # ///////////////////////////////////////////////////////////////
-        widgets.tableWidget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.jobs_model = JobsModel(self)
+        widgets.jobs_view = QTableView(widgets.row_3)
+        widgets.jobs_view.setModel(self.jobs_model)
+        widgets.jobs_view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        widgets.jobs_view.horizontalHeader().setStretchLastSection(True)
+        widgets.jobs_view.setColumnWidth(0, 520)
+        # Fixed row height: the view never measures rows, whatever their number
+        widgets.jobs_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        widgets.jobs_view.verticalHeader().setDefaultSectionSize(24)
+        widgets.jobs_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        widgets.horizontalLayout_12.replaceWidget(widgets.tableWidget, widgets.jobs_view)
+        widgets.tableWidget.hide()
 
         # Configure scraping page widgets
         widgets.label.setText("\ud83d\udcf7 Scraping Image")
@@ -101,6 +152,12 @@ class MainWindow(QMainWindow):
             "QPushButton {background-color:#44475a; padding:6px 12px; border-radius:6px;}"
             "QPushButton:hover {background-color:#51546e;}"
         )
+        widgets.btn_cancel_scraping.setCursor(Qt.PointingHandCursor)
+        widgets.btn_cancel_scraping.setStyleSheet(
+            "QPushButton {background-color:#ff5555; padding:6px 12px; border-radius:6px;}"
+            "QPushButton:hover {background-color:#ff6e6e;}"
+            "QPushButton:disabled {background-color:#44475a;}"
+        )
 
         # Create settings page (4th tab)
         settings_page = QWidget()
@@ -173,6 +230,11 @@ class MainWindow(QMainWindow):
             # SET HACKS
             AppFunctions.setThemeHack(self)
 
+        # The jobs dashboard is a QTableView: give it the QTableWidget styles
+        widgets.styleSheet.setStyleSheet(
+            widgets.styleSheet.styleSheet().replace("QTableWidget", "QTableView")
+        )
+
         # SET HOME PAGE AND SELECT MENU
         # ///////////////////////////////////////////////////////////////
         widgets.stackedWidget.setCurrentWidget(widgets.home)
@@ -225,48 +287,81 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Erreur", "Veuillez saisir un sélecteur CSS.")
             return
 
-        try:
-            # Logger envoyant les messages dans log_browser
-            import logging
-            import time
-            from pathlib import Path
-
-            class QTextEditLogger(logging.Handler):
-                def __init__(self, text_edit):
-                    super().__init__()
-                    self.text_edit = text_edit
-
-                def emit(self, record):
-                    msg = self.format(record)
-                    self.text_edit.append(msg)
-
-            logger = logging.getLogger("ScrapingLogger")
-            logger.setLevel(logging.INFO)
-            logger.handlers.clear()
-
-            log_handler = QTextEditLogger(widgets.log_browser)
-            log_handler.setFormatter(logging.Formatter("%(message)s"))
-            logger.addHandler(log_handler)
-
-            before = len(list(Path("images").glob("*")))
-            start = time.time()
-
-            import scrape_images
-            scrape_images.scrape_images(url, selector=selector, logger=logger)
-
-            elapsed = time.time() - start
-            after = len(list(Path("images").glob("*")))
-            downloaded = max(0, after - before)
-            logger.info("\U0001F5BC %d images téléchargées", downloaded)
-            logger.info("Durée : %.2fs", elapsed)
-
-        except Exception as e:
-            QMessageBox.critical(self, "Erreur", f"Erreur lors du scraping : {e}")
+        # Le scraping tourne dans un thread du pool ; ses signaux sont reçus
+        # par des méthodes de widgets, donc exécutés dans le thread de l'interface
+        worker = ScrapeWorker(url, selector, pool=self.driver_pool, logger=self.scrape_logger)
+        worker.signals.started.connect(self.scraping_started)
+        worker.signals.image_done.connect(self.scraping_image_done)
+        worker.signals.finished.connect(self.scraping_finished)
+        worker.signals.error.connect(self.scraping_error)
+        self.scrape_workers.append(worker)
+        self.next_job_id += 1
+        self.job_ids[worker.signals] = self.next_job_id
+        self.jobs_model.update((self.next_job_id, 0), url=url, status="en attente")
+        self.scrape_pool.start(worker)
+        self.update_scraping_status()
+
+    def cancel_scraping(self):
+        if not self.scrape_workers:
+            return
+        for worker in list(self.scrape_workers):
+            # Scrapes still queued are simply dropped
+            if self.scrape_pool.tryTake(worker):
+                job = self.forget_worker(worker.signals)
+                self.jobs_model.update((job, 0), status="annulé")
+            else:
+                worker.cancel()
+        self.scrape_logger.info("\u23f9 Annulation demandée...")
+
+    def scraping_started(self):
+        self.jobs_model.update((self.job_ids[self.sender()], 0), status="en cours")
+
+    def scraping_image_done(self, image):
+        self.images_processed += 1
+        self.jobs_model.update_image(self.job_ids[self.sender()], image)
+        self.update_scraping_status()
+
+    def scraping_finished(self, result):
+        job = self.forget_worker(self.sender())
+        self.jobs_model.update(
+            (job, 0),
+            status=result.error or f"{result.downloaded}/{result.found} images",
+            bytes=result.bytes,
+            throughput=result.bytes / result.duration if result.duration else None,
+        )
+        for image in result.images:
+            if image.status == "failed":
+                self.scrape_logger.info("\u274c Image %d : %s", image.index, image.error)
+        self.scrape_logger.info("\U0001F5BC %d images téléchargées", result.downloaded)
+        self.scrape_logger.info(result.describe())
+
+    def scraping_error(self, message):
+        job = self.forget_worker(self.sender())
+        self.jobs_model.update((job, 0), status=f"erreur : {message}")
+        if self.closing:
+            return
+        QMessageBox.critical(self, "Erreur", f"Erreur lors du scraping : {message}")
+
+    def forget_worker(self, signals):
+        self.scrape_workers = [w for w in self.scrape_workers if w.signals is not signals]
+        self.update_scraping_status()
+        return self.job_ids.pop(signals)
+
+    def update_scraping_status(self):
+        running = len(self.scrape_workers)
+        widgets.btn_cancel_scraping.setEnabled(running > 0)
+        if running:
+            widgets.label_progress.setText(
+                f"\u23f3 {running} en cours, {self.images_processed} images"
+            )
+        else:
+            widgets.label_progress.setText("")
+            self.images_processed = 0
 
     def reset_fields(self):
         widgets.lineEdit_url.clear()
         widgets.lineEdit_selector.clear()
-        widgets.log_browser.clear()
+        self.log_sink.clear()
 
     # RESIZE EVENTS
     # ///////////////////////////////////////////////////////////////
@@ -274,6 +369,20 @@ class MainWindow(QMainWindow):
         # Update Size Grips
         UIFunctions.resize_grips(self)
 
+    # CLOSE EVENTS
+    # ///////////////////////////////////////////////////////////////
+    def closeEvent(self, event):
+        # Drop the queued scrapes and stop the running ones. A page load cannot
+        # be cancelled, so browsers still borrowed after the timeout are quit,
+        # which makes their scrapes fail right away
+        self.closing = True
+        self.cancel_scraping()
+        if not self.scrape_pool.waitForDone(SHUTDOWN_TIMEOUT):
+            self.driver_pool.close(quit_borrowed=True)
+            self.scrape_pool.waitForDone(SHUTDOWN_TIMEOUT)
+        self.driver_pool.close()
+        QMainWindow.closeEvent(self, event)
+
     # MOUSE CLICK EVENTS
     # ///////////////////////////////////////////////////////////////
     def mousePressEvent(self, event):
@@ -17,6 +17,10 @@ from PySide6.QtCore import *
 from PySide6.QtGui import *
 from PySide6.QtWidgets import *
 
+# QT RESOURCES (before ui_main, whose "import resources_rc" they replace)
+from . resources import load_resources
+load_resources()
+
 # GUI FILE
 from . ui_main import Ui_MainWindow
 
@@ -28,3 +32,8 @@ from . ui_functions import *
 
 # APP FUNCTIONS
 from . app_functions import *
+
+# SCRAPING WORKER, LOGS AND JOBS DASHBOARD
+from . scrape_worker import ScrapeWorker
+from . log_sink import LogSink
+from . jobs_model import JobsModel
@@ -0,0 +1,128 @@
+"""Table model of the scraping dashboard.
+
+One row per scraped page and one per image, with its status, size,
+throughput and latency. Updates are only recorded when they arrive; a timer
+applies them a few times per second with a single ``rowsInserted`` and a
+single ``dataChanged`` for all the rows touched, so the view stays fluid with
+tens of thousands of rows.
+"""
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
+
+# Fields of a row, in column order
+_FIELDS = ("url", "status", "bytes", "throughput", "latency")
+
+# Labels of the ImageResult statuses
+_STATUS_LABELS = {
+    "downloaded": "téléchargée",
+    "not-modified": "inchangée",
+    "skipped": "ignorée",
+    "cancelled": "annulée",
+    "failed": "échec",
+}
+
+
+class JobsModel(QAbstractTableModel):
+    """Rows keyed by ``(job, image index)``, index 0 being the page itself.
+
+    ``update`` must be called from the GUI thread (e.g. from slots connected
+    to the scraping signals).
+    """
+
+    HEADERS = ("URL", "Statut", "Taille", "Débit", "Latence")
+
+    def __init__(self, parent=None, interval=200):
+        super().__init__(parent)
+        self._rows = []
+        self._row_of = {}
+        self._pending = {}
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.apply_pending)
+        self.timer.start()
+
+    # MODEL API
+    # ///////////////////////////////////////////////////////////////
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(_FIELDS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        field = _FIELDS[index.column()]
+        if role == Qt.DisplayRole:
+            return _display(field, row.get(field))
+        if role == Qt.TextAlignmentRole and field != "url":
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    # UPDATES
+    # ///////////////////////////////////////////////////////////////
+    def update(self, key, **fields):
+        """Record new values for the row ``key``, created if unknown."""
+
+        self._pending.setdefault(key, {}).update(fields)
+
+    def update_image(self, job, image):
+        """Record a ``scrape_images.ImageResult`` of ``job``."""
+
+        self.update(
+            (job, image.index),
+            url=f"    {image.url or '-'}",
+            status=_STATUS_LABELS.get(image.status, image.status),
+            bytes=image.bytes,
+            throughput=image.bytes / image.duration if image.duration else None,
+            latency=image.latency or None,
+        )
+
+    def apply_pending(self):
+        """Apply the recorded updates with one signal per kind of change."""
+
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        new_keys = [key for key in pending if key not in self._row_of]
+        if new_keys:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_keys) - 1)
+            for key in new_keys:
+                self._row_of[key] = len(self._rows)
+                self._rows.append(pending.pop(key))
+            self.endInsertRows()
+        if pending:
+            changed = [self._row_of[key] for key in pending]
+            for key, fields in pending.items():
+                self._rows[self._row_of[key]].update(fields)
+            self.dataChanged.emit(
+                self.index(min(changed), 0),
+                self.index(max(changed), len(_FIELDS) - 1),
+                [Qt.DisplayRole],
+            )
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows.clear()
+        self._row_of.clear()
+        self._pending.clear()
+        self.endResetModel()
+
+
+def _display(field, value):
+    if value is None:
+        return ""
+    if field == "bytes":
+        return f"{value / 1024:.0f} Ko"
+    if field == "throughput":
+        return f"{value / 1024:.0f} Ko/s"
+    if field == "latency":
+        return f"{value * 1000:.0f} ms"
+    return str(value)
@@ -0,0 +1,62 @@
+"""Logging handler writing to a text widget in batches.
+
+Appending every record to a ``QTextEdit`` relayouts the widget each time,
+which dominates the UI when downloads log concurrently. :class:`LogSink`
+only queues the formatted lines (from any thread) and a timer of the GUI
+thread inserts them in one edit a few times per second. The widget keeps
+the last ``max_lines`` lines.
+"""
+
+import logging
+from collections import deque
+
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QTextCursor
+
+
+class LogSink(logging.Handler):
+    """Buffer records and flush them to ``text_edit`` every ``interval`` ms.
+
+    Must be created in the GUI thread; ``emit`` may be called from any thread.
+    """
+
+    def __init__(self, text_edit, interval=100, max_lines=5000):
+        super().__init__()
+        self.text_edit = text_edit
+        text_edit.document().setMaximumBlockCount(max_lines)
+        # Lines older than what the widget keeps are dropped right away
+        self._pending = deque(maxlen=max_lines)
+        self.timer = QTimer(text_edit)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.write_pending)
+        self.timer.start()
+
+    def emit(self, record):
+        try:
+            self._pending.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    def write_pending(self):
+        lines = []
+        while self._pending:
+            lines.append(self._pending.popleft())
+        if not lines:
+            return
+        scrollbar = self.text_edit.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        if not self.text_edit.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText("\n".join(lines))
+        cursor.endEditBlock()
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def clear(self):
+        """Drop the lines not flushed yet and empty the widget."""
+
+        self._pending.clear()
+        self.text_edit.clear()
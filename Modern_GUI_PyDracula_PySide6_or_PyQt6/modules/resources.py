@@ -0,0 +1,114 @@
+"""Register the Qt resources (icons and images) without importing resources_rc.
+
+``resources_rc.py`` embeds every icon as Python byte literals: importing it
+parses ~930 KB of source at each launch. :func:`load_resources` registers a
+binary ``resources.rcc`` instead, which Qt memory-maps and reads on demand,
+and makes ``import resources_rc`` in ``ui_main.py`` a no-op. The ``.rcc`` is
+built from ``resources_rc.py`` the first time (or with ``--build``), so the two
+never diverge; set ``GUI_RESOURCES=module`` to import the Python module as
+before.
+
+Run ``python modules/resources.py --benchmark`` to compare both startups.
+"""
+
+import argparse
+import os
+import statistics
+import struct
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+from PySide6.QtCore import QResource
+
+RCC_FILE = Path(__file__).with_name("resources.rcc")
+RESOURCES_MODE = os.environ.get("GUI_RESOURCES", "rcc")
+
+# Binary resource format written by rcc: "qres", then big-endian version,
+# offsets of the tree, data and names sections, and (version 3) flags
+_RCC_VERSION = 3
+_RCC_HEADER = struct.Struct(">4sIIIII")
+
+
+def build_rcc(path=RCC_FILE):
+    """Write the resources embedded in ``resources_rc.py`` to a binary ``.rcc``."""
+
+    import resources_rc
+
+    data = resources_rc.qt_resource_data
+    names = resources_rc.qt_resource_name
+    tree = resources_rc.qt_resource_struct
+    data_offset = _RCC_HEADER.size
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    header = _RCC_HEADER.pack(
+        b"qres", _RCC_VERSION, tree_offset, data_offset, names_offset, 0
+    )
+    tmp_path = Path(f"{path}.part")
+    with open(tmp_path, "wb") as f:
+        f.write(header + data + names + tree)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _is_stale(path):
+    source = Path(__file__).with_name("resources_rc.py")
+    return source.exists() and source.stat().st_mtime > path.stat().st_mtime
+
+
+def load_resources(mode=RESOURCES_MODE, path=RCC_FILE):
+    """Register the application resources and return the mode actually used.
+
+    In ``"rcc"`` mode the ``.rcc`` is (re)built if missing or older than
+    ``resources_rc.py``; if it cannot be written or registered, the Python
+    module is imported instead.
+    """
+
+    path = Path(path)
+    if mode == "rcc":
+        try:
+            if not path.exists() or _is_stale(path):
+                build_rcc(path)
+        except (ImportError, OSError):
+            pass
+        if path.exists() and QResource.registerResource(str(path)):
+            sys.modules.setdefault("resources_rc", types.ModuleType("resources_rc"))
+            return "rcc"
+    import resources_rc
+    return "module"
+
+
+def benchmark(runs=10):
+    """Time a fresh interpreter registering the resources in each mode."""
+
+    directory = Path(__file__).parent
+    load_resources("rcc")  # build the .rcc before timing
+    # PySide6 itself is imported before the clock starts: both modes need it
+    code = (
+        "import time, resources; start = time.perf_counter(); "
+        "resources.load_resources({mode!r}); print(time.perf_counter() - start)"
+    )
+    for mode in ("module", "rcc"):
+        timings = []
+        for _ in range(runs):
+            output = subprocess.run(
+                [sys.executable, "-c", code.format(mode=mode)],
+                cwd=directory,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            timings.append(float(output))
+        print(f"{mode:6} : {statistics.median(timings) * 1000:7.1f} ms (median of {runs})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Qt resources of the GUI")
+    parser.add_argument("--build", action="store_true", help="rebuild resources.rcc")
+    parser.add_argument("--benchmark", action="store_true", help="compare startup times")
+    args = parser.parse_args()
+    if args.build:
+        print(build_rcc())
+    if args.benchmark:
+        benchmark()
@@ -0,0 +1,99 @@
+"""Run ``scrape_images`` off the Qt main thread.
+
+The window stays responsive while Chrome loads the page and images are
+downloaded: each scrape is a :class:`ScrapeWorker` started on a
+``QThreadPool`` and reports back through the signals of
+:class:`ScrapeSignals`, which Qt delivers on the GUI thread.
+"""
+
+import logging
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+import scrape_images
+
+
+class ScrapeSignals(QObject):
+    # SIGNALS
+    # Emitted from the worker thread and queued to slots of GUI objects.
+    # Connect them to methods of a QObject (not to lambdas), otherwise the
+    # slot runs in the worker thread.
+    # ///////////////////////////////////////////////////////////////
+    started = Signal()  # the worker left the pool's queue
+    log = Signal(str)
+    progress = Signal(int)  # images processed so far
+    image_done = Signal(object)  # scrape_images.ImageResult
+    finished = Signal(object)  # scrape_images.ScrapeResult
+    error = Signal(str)
+
+
+class _SignalLogHandler(logging.Handler):
+    """Send formatted records through a ``Signal(str)``."""
+
+    def __init__(self, signal):
+        super().__init__()
+        self.signal = signal
+
+    def emit(self, record):
+        self.signal.emit(self.format(record))
+
+
+class ScrapeWorker(QRunnable):
+    """Scrape ``url`` in a pool thread; extra options go to ``scrape_images``.
+
+    Records go to ``logger`` when given (its handlers must be thread-safe,
+    see :class:`LogSink`), otherwise through the ``log`` signal.
+    """
+
+    def __init__(self, url, selector, pool=None, logger=None, **options):
+        super().__init__()
+        # Kept alive by its owner until ``finished``: the window may still call
+        # QThreadPool.tryTake on it after run() returned
+        self.setAutoDelete(False)
+        self.url = url
+        self.selector = selector
+        self.pool = pool
+        self.logger = logger
+        self.options = options
+        self.signals = ScrapeSignals()
+        self.cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._processed = 0
+
+    def cancel(self):
+        """Stop before the next download; the page being loaded is not interrupted."""
+
+        self.cancel_event.set()
+
+    def run(self):
+        self.signals.started.emit()
+        logger = self.logger
+        if logger is None:
+            # Private logger: several workers may run at the same time
+            logger = logging.Logger("ScrapingLogger", logging.INFO)
+            handler = _SignalLogHandler(self.signals.log)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+        try:
+            result = scrape_images.scrape_images(
+                self.url,
+                logger,
+                selector=self.selector,
+                pool=self.pool,
+                cancel_event=self.cancel_event,
+                on_image=self._image_done,
+                **self.options,
+            )
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+    def _image_done(self, image):
+        # Called concurrently by the download threads
+        with self._lock:
+            self._processed += 1
+            processed = self._processed
+        self.signals.image_done.emit(image)
+        self.signals.progress.emit(processed)
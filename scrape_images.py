@@ -1,19 +1,56 @@
 import os
 import random
+import re
+import shutil
+import subprocess
+import sys
 import time
 from pathlib import Path
+import json
 import logging
+import logging.handlers
+import multiprocessing
+import multiprocessing.util
 import argparse
-from typing import Optional
+import asyncio
+import hashlib
+import queue
+import socket
+import threading
+import uuid
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import ExitStack, contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+from urllib.parse import parse_qsl, urldefrag, urlencode, urljoin, urlparse, urlsplit, urlunsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 IMAGE_DIR = Path("images")
 PRODUCT_URL = os.environ.get(
     "PRODUCT_URL",
@@ -23,6 +60,35 @@ PRODUCT_URL = os.environ.get(
 # Default CSS selector for product images
 DEFAULT_SELECTOR = "div[data-media-type='image'] img"
 
+# Ways of finding the image URLs, tried in order until one yields something:
+# Shopify product JSON, plain HTTP fetch + HTML parsing, then a real browser
+# for client-side galleries. The Shopify JSON ignores the CSS selector, so it is
+# only part of the defaults when the selector is DEFAULT_SELECTOR
+BACKENDS = ("shopify", "http", "browser")
+DEFAULT_BACKENDS = ("shopify", "http", "browser")
+SELECTOR_BACKENDS = ("http", "browser")
+
+# <img> attributes holding the image URL, in priority order
+SRCSET_ATTRIBUTES = ("srcset", "data-srcset", "data-lazy")
+SRC_ATTRIBUTES = ("src", "data-src", "data-photoswipe-src")
+
+# Query parameters that only bust caches, ignored when comparing URLs so that
+# each asset is fetched once. Generic names such as ``t`` may select content
+# (``render?id=1&t=thumb``) and are kept
+CACHE_BUSTING_PARAMS = frozenset({"v", "version"})
+# Query parameters selecting a rendition of the same asset
+SIZE_PARAMS = frozenset({"width", "height", "w", "h", "crop"})
+# CDN size suffix before the extension: name_800x.jpg, name_800x600_crop_center.jpg,
+# name_x600@2x.jpg
+_SIZE_SUFFIX_RE = re.compile(
+    r"_(?:(\d+)x(\d*)|x(\d+))(?:_crop_[a-z]+)?(?:@(\d)x)?(?=\.[A-Za-z0-9]+$)"
+)
+
+# Width requested from CDNs that resize on the fly (None: largest available),
+# and the width used to fill ``{width}`` templates when no target is set
+TARGET_WIDTH = int(os.environ["TARGET_WIDTH"]) if os.environ.get("TARGET_WIDTH") else None
+PLACEHOLDER_WIDTH = 2048
+
 # Optional defaults for customization
 DEFAULT_USER_AGENT = os.environ.get(
     "USER_AGENT",
@@ -30,10 +96,229 @@ DEFAULT_USER_AGENT = os.environ.get(
 )
 PROXY_URL = os.environ.get("PROXY_URL")
 
+# Download concurrency: total worker threads and simultaneous requests per host
+DEFAULT_MAX_WORKERS = int(os.environ.get("MAX_WORKERS", "8"))
+DEFAULT_PER_HOST_LIMIT = int(os.environ.get("PER_HOST_LIMIT", "4"))
+
+# Retry policy for transient HTTP errors: attempts per request, exponential
+# backoff factor and random jitter added to each wait (seconds), retried status
+# codes and the longest ``Retry-After`` delay honored
+DEFAULT_RETRIES = int(os.environ.get("RETRIES", "3"))
+DEFAULT_BACKOFF_FACTOR = float(os.environ.get("BACKOFF_FACTOR", "0.5"))
+DEFAULT_BACKOFF_JITTER = float(os.environ.get("BACKOFF_JITTER", "0.5"))
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRY_AFTER = 60.0
+
+# Client used for image downloads: requests (HTTP/1.1) or httpx with HTTP/2
+HTTP_CLIENTS = ("requests", "http2")
+DEFAULT_HTTP_CLIENT = os.environ.get("HTTP_CLIENT", "requests")
+
+# Size of the blocks streamed from the network to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Content-addressed storage: blobs directory (disabled when unset)
+BLOB_STORE_DIR = os.environ.get("BLOB_STORE_DIR")
+MANIFEST_NAME = "manifest.json"
+
+# Conditional download cache: ETag/Last-Modified per image URL (disabled when
+# unset) and minimum delay between two writes of the cache file
+HTTP_CACHE_FILE = os.environ.get("HTTP_CACHE_FILE")
+HTTP_CACHE_FLUSH_INTERVAL = 30.0
+
+# Driver pool: number of warm browsers and pages served before a browser is recycled
+DEFAULT_POOL_SIZE = int(os.environ.get("DRIVER_POOL_SIZE", "1"))
+DEFAULT_MAX_PAGES = int(os.environ.get("DRIVER_MAX_PAGES", "50"))
+
+# Batch mode engines
+ENGINES = ("threads", "async", "processes")
+
+# Asynchronous pipeline: product pages loaded at the same time and images
+# waiting to be downloaded (bounds memory when thousands of URLs are queued)
+DEFAULT_PAGE_CONCURRENCY = int(os.environ.get("PAGE_CONCURRENCY", "4"))
+DEFAULT_QUEUE_SIZE = int(os.environ.get("QUEUE_SIZE", "64"))
+
+# chromedriver resolution: pre-provisioned binary, offline mode and version cache
+CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH")
+OFFLINE = os.environ.get("SCRAPER_OFFLINE", "").lower() in ("1", "true", "yes")
+DRIVER_CACHE_FILE = Path(
+    os.environ.get(
+        "DRIVER_CACHE_FILE",
+        Path.home() / ".cache" / "vrai-scrap" / "chromedriver.json",
+    )
+)
+# Page readiness: strategy used by fetch_images, its timeout, and the optional
+# human-like pause (min, max seconds) taken once the page is ready
+WAIT_STRATEGIES = ("selector", "dom", "network-idle", "script")
+DEFAULT_WAIT_STRATEGY = os.environ.get("WAIT_STRATEGY", "selector")
+DEFAULT_WAIT_TIMEOUT = float(os.environ.get("WAIT_TIMEOUT", "10"))
+DEFAULT_DELAY = (0.0, 0.0)
+
+# Lazy galleries: scroll until the matched images stop changing for
+# LAZY_LOAD_STABLE seconds (disabled by default)
+DEFAULT_LAZY_LOAD = os.environ.get("LAZY_LOAD", "").lower() in ("1", "true", "yes")
+LAZY_LOAD_STABLE = 0.5
+
+# Requests Chrome refuses while URLs are extracted (Network.setBlockedURLs
+# wildcard patterns): "media" skips video, audio, fonts and trackers,
+# "aggressive" also image bodies since only their URLs are read
+_MEDIA_PATTERNS = (
+    "*.mp4*",
+    "*.webm*",
+    "*.m3u8*",
+    "*.mov*",
+    "*.mp3*",
+    "*.ogg*",
+    "*.woff*",
+    "*.ttf*",
+    "*.otf*",
+    "*.eot*",
+)
+_TRACKER_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+    "*analytics.tiktok.com*",
+    "*bat.bing.com*",
+    "*snap.licdn.com*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*static.klaviyo.com*",
+)
+_IMAGE_PATTERNS = ("*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*")
+BLOCK_PROFILES = {
+    "none": (),
+    "media": _MEDIA_PATTERNS + _TRACKER_PATTERNS,
+    "aggressive": _MEDIA_PATTERNS + _TRACKER_PATTERNS + _IMAGE_PATTERNS,
+}
+DEFAULT_BLOCK_PROFILE = os.environ.get("BLOCK_PROFILE", "media")
+
+# Chrome executables probed for the version: names looked up on PATH, then the
+# macOS application bundles, which are never on PATH
+CHROME_BINARIES = (
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    "/Applications/Chromium.app/Contents/MacOS/Chromium",
+)
+
+
+def _chrome_version() -> Optional[str]:
+    """Return the version of the installed Chrome, or ``None`` if unknown."""
+
+    if sys.platform == "win32":
+        try:
+            import winreg
+
+            with winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon"
+            ) as key:
+                return winreg.QueryValueEx(key, "version")[0]
+        except OSError:
+            return None
+
+    for name in CHROME_BINARIES:
+        binary = shutil.which(name)
+        if not binary:
+            continue
+        try:
+            output = subprocess.run(
+                [binary, "--version"], capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"\d+(?:\.\d+)+", output)
+        if match:
+            return match.group(0)
+    return None
+
+
+def _load_driver_cache(cache_file: Path) -> Dict[str, str]:
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+# Serializes resolve_driver_path: lru_cache alone lets the first concurrent
+# calls (one per pooled browser) all run ChromeDriverManager
+_DRIVER_PATH_LOCK = threading.Lock()
+
+
+def resolve_driver_path(
+    driver_path: Optional[str] = None,
+    offline: bool = False,
+    cache_file: Path = DRIVER_CACHE_FILE,
+) -> str:
+    """Return the chromedriver binary to use, downloading it only when needed.
+
+    An explicit ``driver_path`` always wins. Otherwise the driver recorded in
+    ``cache_file`` for the installed Chrome version is reused, and
+    ``ChromeDriverManager`` is only consulted on a cache miss. In ``offline``
+    mode no network lookup is ever made. The result is memoized per process.
+    """
+
+    with _DRIVER_PATH_LOCK:
+        return _resolve_driver_path(driver_path, offline, cache_file)
+
+
+@lru_cache(maxsize=None)
+def _resolve_driver_path(
+    driver_path: Optional[str],
+    offline: bool,
+    cache_file: Path,
+) -> str:
+    if driver_path:
+        if not os.path.isfile(driver_path):
+            raise FileNotFoundError(f"chromedriver introuvable : {driver_path}")
+        return driver_path
+
+    version = _chrome_version()
+    cache = _load_driver_cache(cache_file)
+    cached = cache.get(version) if version else None
+    if cached and os.path.isfile(cached):
+        return cached
+
+    if offline:
+        raise RuntimeError(
+            "Mode hors ligne : aucun chromedriver en cache pour Chrome "
+            f"{version or 'inconnu'}, indiquez --driver-path ou CHROMEDRIVER_PATH"
+        )
+
+    path = ChromeDriverManager().install()
+    if version:
+        cache[version] = path
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "w", encoding="utf-8") as f:
+                json.dump(cache, f, indent=2)
+        except OSError:
+            pass
+    return path
+
 
-def setup_driver(user_agent: str = DEFAULT_USER_AGENT, proxy_url: Optional[str] = None) -> webdriver.Chrome:
-    """Configure and return a Chrome WebDriver in stealth mode."""
+def setup_driver(
+    user_agent: str = DEFAULT_USER_AGENT,
+    proxy_url: Optional[str] = None,
+    driver_path: Optional[str] = CHROMEDRIVER_PATH,
+    offline: bool = OFFLINE,
+    block: str = DEFAULT_BLOCK_PROFILE,
+) -> webdriver.Chrome:
+    """Configure and return a Chrome WebDriver in stealth mode.
+
+    Requests matching the ``block`` profile (see ``BLOCK_PROFILES``) are
+    refused by the browser. ``"aggressive"`` also skips image bodies: the
+    gallery URLs are still read, but the fallback that measures rendered
+    images may then find fewer of them.
+    """
 
+    patterns = BLOCK_PROFILES.get(block)
+    if patterns is None:
+        raise ValueError(f"Profil de blocage inconnu : {block}")
     options = webdriver.ChromeOptions()
     options.add_argument("--headless=new")
     options.add_argument("--disable-blink-features=AutomationControlled")
@@ -47,56 +332,370 @@ def setup_driver(user_agent: str = DEFAULT_USER_AGENT, proxy_url: Optional[str]
         options.add_argument(f"--proxy-server={proxy_url}")
 
     driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()), options=options
+        service=Service(resolve_driver_path(driver_path, offline)), options=options
     )
     driver.execute_cdp_cmd(
         "Page.addScriptToEvaluateOnNewDocument",
         {"source": "Object.defineProperty(navigator,'webdriver',{get:()=>undefined})"},
     )
+    if patterns:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
     return driver
 
 
-def fetch_images(driver: webdriver.Chrome, url: str, selector: str):
-    """Return <img> elements matching ``selector`` or use a fallback."""
-    driver.get(url)
-    time.sleep(random.uniform(2, 4))
-    wait = WebDriverWait(driver, 10)
+class DriverPool:
+    """Keep warm Chrome instances and lend them out one page at a time.
+
+    Browsers are started lazily up to ``size``. Each checkout is health-checked
+    and a browser is replaced after ``max_pages`` pages or when it stops
+    responding. Extra keyword arguments are passed to :func:`setup_driver`.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        **driver_options,
+    ):
+        self.size = max(1, size)
+        self.max_pages = max(1, max_pages)
+        self.driver_options = driver_options
+        self._idle: List[webdriver.Chrome] = []
+        self._pages: Dict[webdriver.Chrome, int] = {}
+        self._lock = threading.Lock()
+        # Notified whenever a driver is given back or a slot is freed
+        self._available = threading.Condition(self._lock)
+        self._created = 0
+        self._closed = False
+
+    def acquire(self, timeout: Optional[float] = None) -> webdriver.Chrome:
+        """Return a healthy driver, starting one if the pool is not full.
+
+        Raises ``queue.Empty`` if no driver becomes available within
+        ``timeout`` and ``RuntimeError`` once the pool is closed.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._available:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Le pool de navigateurs est ferm\u00e9")
+                    if self._idle:
+                        driver = self._idle.pop()
+                        break
+                    if self._created < self.size:
+                        self._created += 1
+                        driver = None
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise queue.Empty
+                    self._available.wait(remaining)
+            if driver is None:
+                return self._start()
+            if self._is_alive(driver):
+                return driver
+            self._discard(driver)
+
+    def release(self, driver: webdriver.Chrome, broken: bool = False) -> None:
+        """Give ``driver`` back, recycling it if it is worn out or broken."""
+
+        with self._lock:
+            if driver not in self._pages:
+                return  # already quit by close(quit_borrowed=True)
+            pages = self._pages[driver] + 1
+            self._pages[driver] = pages
+            retire = broken or self._closed or pages >= self.max_pages
+        if not retire:
+            try:
+                driver.get("about:blank")
+            except Exception:
+                retire = True
+        if retire:
+            self._discard(driver)
+            return
+        with self._available:
+            if not self._closed:
+                self._idle.append(driver)
+                self._available.notify()
+                return
+        self._discard(driver)
+
+    @contextmanager
+    def driver(self):
+        """Borrow a driver for the duration of a ``with`` block."""
 
+        driver = self.acquire()
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            broken = not self._is_alive(driver)
+            raise
+        finally:
+            self.release(driver, broken)
+
+    def close(self, quit_borrowed: bool = False) -> None:
+        """Quit every idle browser and wake up the threads waiting for one.
+
+        Borrowed browsers are quit on release, or right away with
+        ``quit_borrowed`` (their page loads then fail in the borrowing threads).
+        """
+
+        with self._available:
+            self._closed = True
+            drivers, self._idle = self._idle, []
+            if quit_borrowed:
+                drivers = list(self._pages)
+            self._available.notify_all()
+        for driver in drivers:
+            self._discard(driver)
+
+    def __enter__(self) -> "DriverPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _start(self) -> webdriver.Chrome:
+        try:
+            driver = setup_driver(**self.driver_options)
+        except Exception:
+            with self._available:
+                self._created -= 1
+                self._available.notify()
+            raise
+        with self._lock:
+            self._pages[driver] = 0
+        return driver
+
+    def _discard(self, driver: webdriver.Chrome) -> None:
+        with self._available:
+            if driver not in self._pages:
+                return
+            del self._pages[driver]
+            self._created -= 1
+            self._available.notify()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_alive(driver: webdriver.Chrome) -> bool:
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+
+@contextmanager
+def _borrow_driver(pool: Optional[DriverPool], **driver_options):
+    """Yield a driver from ``pool`` or a throwaway one if no pool is given."""
+
+    if pool is not None:
+        with pool.driver() as driver:
+            yield driver
+        return
+    driver = setup_driver(**driver_options)
     try:
-        wait.until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector))
-        )
-    except Exception:
-        # If the explicit selector fails we will use the fallback
-        pass
+        yield driver
+    finally:
+        driver.quit()
+
+
+# Fallback filter evaluated in the page in one round-trip: visible <img> of at
+# least MIN_FALLBACK_SIZE pixels whose own and parent classes do not mention
+# "thumbnail"
+MIN_FALLBACK_SIZE = 300
+_FALLBACK_IMAGES_JS = """
+const minSize = arguments[0];
+return Array.from(document.images).filter(img => {
+    if (!img.getClientRects().length) return false;
+    const style = getComputedStyle(img);
+    if (style.visibility === 'hidden' || style.opacity === '0') return false;
+    const rect = img.getBoundingClientRect();
+    if (rect.width < minSize || rect.height < minSize) return false;
+    const cls = (img.getAttribute('class') || '').toLowerCase();
+    const parent = img.parentElement;
+    const parentCls = parent ? (parent.getAttribute('class') || '').toLowerCase() : '';
+    return !cls.includes('thumbnail') && !parentCls.includes('thumbnail');
+});
+"""
+
+
+class _NetworkIdle:
+    """Wait condition met once no new resource has loaded for ``idle`` seconds."""
+
+    SCRIPT = (
+        "if (document.readyState !== 'complete') return -1;"
+        "performance.setResourceTimingBufferSize(100000);"
+        "return performance.getEntriesByType('resource').length;"
+    )
+
+    def __init__(self, idle: float = 0.5):
+        self.idle = idle
+        self._count = -1
+        self._since = 0.0
+
+    def __call__(self, driver: webdriver.Chrome) -> bool:
+        count = driver.execute_script(self.SCRIPT)
+        now = time.monotonic()
+        if count < 0 or count != self._count:
+            self._count = count
+            self._since = now
+            return False
+        return now - self._since >= self.idle
+
+
+def wait_until_ready(
+    driver: webdriver.Chrome,
+    selector: str,
+    strategy: str = DEFAULT_WAIT_STRATEGY,
+    timeout: float = DEFAULT_WAIT_TIMEOUT,
+    script: Optional[str] = None,
+) -> bool:
+    """Block until the loaded page is ready and return ``False`` on timeout.
+
+    ``"selector"`` returns as soon as ``selector`` matches, ``"dom"`` once
+    ``document.readyState`` is complete, ``"network-idle"`` when no resource has
+    been fetched for half a second and ``"script"`` when the JavaScript
+    expression ``script`` evaluates to a truthy value.
+    """
+
+    if strategy == "selector":
+        condition = EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector))
+    elif strategy == "dom":
+        def condition(d):
+            return d.execute_script("return document.readyState") == "complete"
+    elif strategy == "network-idle":
+        condition = _NetworkIdle()
+    elif strategy == "script":
+        if not script:
+            raise ValueError("La stratégie 'script' nécessite une expression JavaScript")
+
+        def condition(d):
+            return d.execute_script(f"return !!({script});")
+    else:
+        raise ValueError(f"Stratégie d'attente inconnue : {strategy}")
+
+    try:
+        WebDriverWait(driver, timeout).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+
+def _politeness_pause(delay: Tuple[float, float] = DEFAULT_DELAY) -> None:
+    """Sleep a random duration within ``delay`` to look less like a bot."""
+
+    low, high = delay
+    if high > 0:
+        time.sleep(random.uniform(low, high))
+
+
+# Async script scrolling the gallery (the nearest scrollable ancestor of the
+# first match, else the page) one viewport at a time. A MutationObserver
+# records when matches are added or their src/srcset change; the callback gets
+# the number of matches once nothing changed for ``stable`` ms and either the
+# end is reached or every match has a real (non data:) source.
+_LAZY_LOAD_JS = """
+const [selector, stable, timeout, done] = arguments;
+const start = performance.now();
+let changed = start;
+const matches = () => document.querySelectorAll(selector);
+const resolved = img => {
+    const src = img.getAttribute('src') || img.getAttribute('srcset') || '';
+    return src !== '' && !src.startsWith('data:');
+};
+const scrollable = el => {
+    const style = getComputedStyle(el);
+    return (el.scrollHeight > el.clientHeight && /auto|scroll/.test(style.overflowY))
+        || (el.scrollWidth > el.clientWidth && /auto|scroll/.test(style.overflowX));
+};
+let box = matches()[0] ? matches()[0].parentElement : null;
+while (box && box !== document.body && !scrollable(box)) box = box.parentElement;
+if (!box || box === document.body) box = document.scrollingElement;
+const observer = new MutationObserver(() => { changed = performance.now(); });
+observer.observe(document.body, {
+    childList: true, subtree: true, attributes: true,
+    attributeFilter: ['src', 'srcset'],
+});
+const tick = () => {
+    const now = performance.now();
+    const found = Array.from(matches());
+    const atEnd = box.scrollTop + box.clientHeight >= box.scrollHeight - 1
+        && box.scrollLeft + box.clientWidth >= box.scrollWidth - 1;
+    if ((now - changed >= stable && (atEnd || found.every(resolved))) || now - start >= timeout) {
+        observer.disconnect();
+        done(found.length);
+        return;
+    }
+    if (!atEnd) {
+        const horizontal = box.scrollWidth > box.clientWidth;
+        box.scrollBy(horizontal ? box.clientWidth * 0.8 : 0, box.clientHeight * 0.8);
+    }
+    setTimeout(tick, 100);
+};
+tick();
+"""
+
+
+def trigger_lazy_load(
+    driver: webdriver.Chrome,
+    selector: str,
+    timeout: float = DEFAULT_WAIT_TIMEOUT,
+    stable: float = LAZY_LOAD_STABLE,
+) -> int:
+    """Scroll the gallery until lazy images matching ``selector`` are populated.
+
+    Stops as soon as the matches have not changed for ``stable`` seconds
+    (see ``_LAZY_LOAD_JS``) or after ``timeout`` seconds, and returns the
+    number of matches.
+    """
+
+    driver.set_script_timeout(timeout + 5)
+    return driver.execute_async_script(_LAZY_LOAD_JS, selector, stable * 1000, timeout * 1000)
+
+
+def fetch_images(
+    driver: webdriver.Chrome,
+    url: str,
+    selector: str,
+    wait_strategy: str = DEFAULT_WAIT_STRATEGY,
+    timeout: float = DEFAULT_WAIT_TIMEOUT,
+    delay: Tuple[float, float] = DEFAULT_DELAY,
+    script: Optional[str] = None,
+    lazy_load: bool = DEFAULT_LAZY_LOAD,
+):
+    """Return <img> elements matching ``selector`` or use a fallback.
+
+    The page is considered loaded according to ``wait_strategy`` (see
+    :func:`wait_until_ready`); ``lazy_load`` then scrolls the gallery until
+    its lazy images are populated (see :func:`trigger_lazy_load`) and
+    ``delay`` adds an optional human-like pause.
+    """
+    driver.get(url)
+    # If the readiness check times out we still try the selector, then the fallback
+    wait_until_ready(driver, selector, wait_strategy, timeout, script)
+    if lazy_load:
+        try:
+            trigger_lazy_load(driver, selector, timeout)
+        except TimeoutException:
+            pass
+    _politeness_pause(delay)
 
     images = driver.find_elements(By.CSS_SELECTOR, selector)
     if images:
         return images
 
     # Fallback: collect visible <img> nodes and filter by dimensions
-    wait.until(EC.presence_of_all_elements_located((By.TAG_NAME, "img")))
-    imgs = driver.find_elements(By.TAG_NAME, "img")
-    filtered = []
-    for img in imgs:
-        if not img.is_displayed():
-            continue
-        width = img.size.get("width", 0)
-        height = img.size.get("height", 0)
-        if width < 300 or height < 300:
-            continue
-        cls = (img.get_attribute("class") or "").lower()
-        parent_cls = ""
-        try:
-            parent_cls = (
-                img.find_element(By.XPATH, "..").get_attribute("class") or ""
-            ).lower()
-        except Exception:
-            pass
-        if "thumbnail" in cls or "thumbnail" in parent_cls:
-            continue
-        filtered.append(img)
-    return filtered
+    WebDriverWait(driver, timeout).until(
+        EC.presence_of_all_elements_located((By.TAG_NAME, "img"))
+    )
+    return driver.execute_script(_FALLBACK_IMAGES_JS, MIN_FALLBACK_SIZE)
 
 
 def _best_url_from_srcset(srcset: str) -> Optional[str]:
@@ -124,25 +723,39 @@ def _best_url_from_srcset(srcset: str) -> Optional[str]:
     return candidates[-1][1]
 
 
-def _extract_image_url(
-    img,
+def _is_placeholder(value: Optional[str]) -> bool:
+    """Tell whether an attribute value is empty or an inline ``data:`` image.
+
+    Lazy galleries ship a tiny ``data:`` GIF in ``src`` and the real URL in
+    ``data-src`` until the image is scrolled into view.
+    """
+
+    return not value or not value.strip() or value.lstrip().lower().startswith("data:")
+
+
+def _url_from_attributes(
+    get_attribute: Callable[[str], Optional[str]],
     index: int,
     logger: Optional[logging.Logger] = None,
 ) -> Optional[str]:
-    """Inspect ``img`` element attributes and return the best image URL."""
+    """Return the best image URL given an attribute getter for one element.
 
-    for attr in ("srcset", "data-srcset", "data-lazy"):
-        value = img.get_attribute(attr)
-        if value:
-            url = _best_url_from_srcset(value) if "," in value else value
+    Empty values and ``data:`` placeholders are skipped.
+    """
+
+    for attr in SRCSET_ATTRIBUTES:
+        value = get_attribute(attr)
+        if not _is_placeholder(value):
+            url = _best_url_from_srcset(value) if "," in value else value.strip()
             if url:
                 return url
 
-    src = (
-        img.get_attribute("src")
-        or img.get_attribute("data-src")
-        or img.get_attribute("data-photoswipe-src")
-    )
+    src = None
+    for attr in SRC_ATTRIBUTES:
+        value = get_attribute(attr)
+        if not _is_placeholder(value):
+            src = value.strip()
+            break
     if not src:
         message = f"\u274C Aucun attribut d'image trouv\u00e9 pour l'\u00e9l\u00e9ment {index}"
         if logger:
@@ -154,28 +767,364 @@ def _extract_image_url(
     return src
 
 
+def _extract_image_url(
+    img,
+    index: int,
+    logger: Optional[logging.Logger] = None,
+) -> Optional[str]:
+    """Inspect ``img`` element attributes and return the best image URL."""
+
+    return _url_from_attributes(img.get_attribute, index, logger)
+
+
+# Reads every candidate attribute of every element in a single round-trip.
+# ``src`` goes through the property so relative URLs come back absolute, as
+# with WebElement.get_attribute.
+_READ_ATTRIBUTES_JS = """
+const names = arguments[1];
+return arguments[0].map(el => {
+    const attrs = {};
+    for (const name of names) {
+        attrs[name] = name === 'src'
+            ? (el.getAttribute('src') ? el.src : null)
+            : el.getAttribute(name);
+    }
+    return attrs;
+});
+"""
+
+
+def extract_image_urls(
+    driver: webdriver.Chrome,
+    elements,
+    logger: Optional[logging.Logger] = None,
+) -> List[Optional[str]]:
+    """Return the best URL of each element using one ``execute_script`` call."""
+
+    if not elements:
+        return []
+    rows = driver.execute_script(
+        _READ_ATTRIBUTES_JS,
+        list(elements),
+        list(SRCSET_ATTRIBUTES + SRC_ATTRIBUTES),
+    )
+    return [
+        _url_from_attributes(row.get, idx, logger)
+        for idx, row in enumerate(rows, 1)
+    ]
+
+
+class HostLimiter:
+    """Bound the number of simultaneous requests sent to a single host."""
+
+    def __init__(self, limit: int = DEFAULT_PER_HOST_LIMIT):
+        self.limit = max(1, limit)
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.Semaphore] = {}
+
+    def _semaphore(self, url: str) -> threading.Semaphore:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.Semaphore(self.limit)
+            return self._semaphores[host]
+
+    @contextmanager
+    def slot(self, url: str):
+        semaphore = self._semaphore(url)
+        with semaphore:
+            yield
+
+
+@dataclass
+class ImageResult:
+    """Outcome of downloading one image of a product page.
+
+    ``status`` is ``"downloaded"``, ``"not-modified"`` (reused after a
+    ``304``), ``"skipped"`` (no usable URL), ``"cancelled"`` or ``"failed"``.
+    ``latency`` is the time until the response headers arrived and
+    ``duration`` the time until the file was written, in seconds.
+    """
+
+    index: int
+    url: Optional[str]
+    path: Optional[Path] = None
+    bytes: int = 0
+    error: Optional[str] = None
+    status: str = "pending"
+    latency: float = 0.0
+    duration: float = 0.0
+
+
+class BlobStore:
+    """Content-addressed image storage shared by every product.
+
+    Files are named after the SHA-256 of their content, so identical images are
+    stored once however many pages or variants reference them.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root).resolve()
+
+    def path_for(self, digest: str, ext: str) -> Path:
+        return self.root / digest[:2] / f"{digest}{ext}"
+
+    def __contains__(self, path: Path) -> bool:
+        return Path(path).resolve().parent.parent == self.root
+
+    def add_file(self, source: Path, ext: str) -> Path:
+        """Store the existing file ``source`` and return its blob path.
+
+        The blob is a hard link to ``source`` when the filesystem allows it:
+        files are only ever replaced (``os.replace``), never rewritten in
+        place, so the blob keeps its content whatever happens to ``source``.
+        """
+
+        hasher = hashlib.sha256()
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        path = self.path_for(hasher.hexdigest(), ext)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _link_or_copy(source, path)
+        return path
+
+    def save(self, response: requests.Response, ext: str) -> Tuple[Path, int]:
+        """Store the body of ``response`` and return its blob path and size.
+
+        Nothing is written under the blob name if that content is already stored.
+        """
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        hasher = hashlib.sha256()
+        tmp_path, size = _stream_to_temp(response, self.root, hasher)
+        path = self.path_for(hasher.hexdigest(), ext)
+        if path.exists():
+            tmp_path.unlink()
+        else:
+            path.parent.mkdir(exist_ok=True)
+            os.replace(tmp_path, path)
+        return path, size
+
+    def write_manifest(
+        self,
+        output_dir: Path,
+        page_url: str,
+        images: Sequence[ImageResult],
+    ) -> Path:
+        """Record in ``output_dir`` which blob holds each image index."""
+
+        manifest = {
+            "url": page_url,
+            "store": str(self.root),
+            "images": {
+                str(image.index): {
+                    "url": image.url,
+                    "blob": image.path.relative_to(self.root).as_posix(),
+                }
+                for image in images
+                if image.path
+            },
+        }
+        path = output_dir / MANIFEST_NAME
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        return path
+
+
+class HttpCache:
+    """On-disk validators used to re-download images conditionally.
+
+    For each URL the ``ETag``/``Last-Modified`` headers and a copy of the body
+    are remembered. The copy lives in a content-addressed directory owned by
+    the cache (next to ``path``) or in the caller's :class:`BlobStore`, never
+    in an output directory where a later download could overwrite it; it is
+    a hard link to the downloaded file where possible, and is deleted once no
+    entry refers to it. The next request sends ``If-None-Match``/
+    ``If-Modified-Since`` and a ``304 Not Modified`` answer reuses the copy
+    without any transfer.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.blobs = BlobStore(self.path.with_name(f"{self.path.stem}_blobs"))
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = {}
+        self._dirty = False
+        self._saved_at = 0.0
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+        # Number of entries pointing at each copy
+        self._refs: Dict[str, int] = {}
+        for entry in self._entries.values():
+            self._refs[entry["path"]] = self._refs.get(entry["path"], 0) + 1
+
+    def headers(self, url: str) -> Dict[str, str]:
+        """Return the conditional headers to send for ``url``.
+
+        Entries whose copy is missing or no longer has the recorded size are
+        dropped, so that the image is downloaded again in full.
+        """
+
+        with self._lock:
+            entry = self._entries.get(url)
+        if not entry:
+            return {}
+        try:
+            valid = os.path.getsize(entry["path"]) == entry.get("size")
+        except OSError:
+            valid = False
+        if not valid:
+            with self._lock:
+                if self._entries.get(url) is entry:
+                    self._set_entry(url, None)
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def cached_path(self, url: str) -> Optional[Path]:
+        with self._lock:
+            entry = self._entries.get(url)
+        return Path(entry["path"]) if entry else None
+
+    def update(
+        self,
+        url: str,
+        response: requests.Response,
+        path: Path,
+        stored: bool = False,
+    ) -> None:
+        """Remember the validators of ``response`` and a copy of its body.
+
+        ``path`` is the saved body; it is linked (or copied) into the cache's
+        own blobs unless ``stored`` says it already is an immutable
+        :class:`BlobStore` blob. The copy of a replaced entry is deleted when
+        no other entry uses it.
+        """
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            with self._lock:
+                self._set_entry(url, None)
+            return
+        source = Path(path)
+        path = self.blobs.add_file(source, source.suffix) if not stored else source
+        with self._lock:
+            if not path.exists():
+                # Deleted meanwhile as the last copy of a replaced entry
+                path = self.blobs.add_file(source, source.suffix)
+            self._set_entry(
+                url,
+                {
+                    "etag": etag or "",
+                    "last_modified": last_modified or "",
+                    "path": str(path.resolve()),
+                    "size": path.stat().st_size,
+                },
+            )
+
+    def _set_entry(self, url: str, entry: Optional[dict]) -> None:
+        # Called with the lock held; ``None`` forgets ``url``
+        old = self._entries.pop(url, None)
+        if entry is not None:
+            self._entries[url] = entry
+            self._refs[entry["path"]] = self._refs.get(entry["path"], 0) + 1
+        if old is None and entry is None:
+            return
+        self._dirty = True
+        if old is None:
+            return
+        refs = self._refs.get(old["path"], 1) - 1
+        if refs > 0:
+            self._refs[old["path"]] = refs
+            return
+        self._refs.pop(old["path"], None)
+        if Path(old["path"]) in self.blobs:
+            try:
+                os.unlink(old["path"])
+            except OSError:
+                pass
+
+    def flush(self) -> None:
+        """Save the cache unless it was saved less than a few seconds ago."""
+
+        if time.monotonic() - self._saved_at >= HTTP_CACHE_FLUSH_INTERVAL:
+            self.save()
+
+    def save(self) -> None:
+        """Write the cache file atomically if anything changed."""
+
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._entries)
+            self._dirty = False
+            self._saved_at = time.monotonic()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.part")
+        tmp_path.write_text(data, encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
 def download_image(
     img,
     index: int,
     session: requests.Session,
     logger: Optional[logging.Logger] = None,
-) -> None:
+) -> Optional[ImageResult]:
     """Extract the URL from ``img`` and save the file."""
 
     src = _extract_image_url(img, index, logger)
     if not src:
-        return
+        return None
+    return _download_url(src, index, session, logger)
+
+
+def _download_url(
+    src: str,
+    index: int,
+    session: requests.Session,
+    logger: Optional[logging.Logger] = None,
+    limiter: Optional[HostLimiter] = None,
+    output_dir: Optional[Path] = None,
+    store: Optional[BlobStore] = None,
+    http_cache: Optional[HttpCache] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> ImageResult:
+    """Save ``src`` as ``image_{index}``, or into ``store`` if one is given.
 
+    With an ``http_cache`` the request is conditional and an unchanged image
+    is taken from the previously saved file. Nothing is requested once
+    ``cancel_event`` is set.
+    """
+
+    result = ImageResult(index, src)
+    if cancel_event is not None and cancel_event.is_set():
+        result.status = "cancelled"
+        result.error = "annul\u00e9"
+        return result
     if "{width}" in src:
         message = f"\u26D4\uFE0F Image ignor\u00e9e (placeholder non r\u00e9solu) : {src}"
         if logger:
             logger.warning(message)
         else:
             print(message)
-        return
+        result.status = "skipped"
+        result.error = "placeholder non r\u00e9solu"
+        return result
 
     if src.startswith("//"):
         src = "https:" + src
+        result.url = src
 
     if logger:
         logger.info("\u2B07\uFE0F T\u00e9l\u00e9chargement image %d: %s", index, src)
@@ -183,85 +1132,1505 @@ def download_image(
         print(f"\u2B07\uFE0F T\u00e9l\u00e9chargement image {index}: {src}")
 
     try:
-        response = session.get(src, timeout=30)
-        response.raise_for_status()
         ext = os.path.splitext(src.split("?")[0])[1] or ".jpg"
-        with open(IMAGE_DIR / f"image_{index}{ext}", "wb") as f:
-            f.write(response.content)
+        target = (output_dir or IMAGE_DIR) / f"image_{index}{ext}"
+        headers = http_cache.headers(src) if http_cache else {}
+        with limiter.slot(src) if limiter else nullcontext():
+            start = time.perf_counter()
+            with session.get(src, timeout=30, stream=True, headers=headers) as response:
+                result.latency = time.perf_counter() - start
+                if response.status_code == 304 and headers:
+                    cached = http_cache.cached_path(src)
+                    if store and cached not in store:
+                        result.path = store.add_file(cached, ext)
+                    elif store:
+                        result.path = cached
+                    else:
+                        _link_or_copy(cached, target)
+                        result.path = target
+                    result.status = "not-modified"
+                    result.duration = time.perf_counter() - start
+                    return result
+                response.raise_for_status()
+                if store:
+                    result.path, result.bytes = store.save(response, ext)
+                else:
+                    result.bytes = _stream_to_file(response, target)
+                    result.path = target
+                result.duration = time.perf_counter() - start
+                if http_cache:
+                    http_cache.update(src, response, result.path, stored=bool(store))
+        result.status = "downloaded"
     except Exception as e:
         if logger:
             logger.error("\u26A0\uFE0F Erreur t\u00e9l\u00e9chargement %s: %s", src, e)
         else:
             print(f"\u26A0\uFE0F Erreur t\u00e9l\u00e9chargement {src}: {e}")
+        result.status = "failed"
+        result.error = str(e)
+    return result
 
 
-def create_session(user_agent: str = DEFAULT_USER_AGENT, proxy_url: Optional[str] = None) -> requests.Session:
-    """Return a ``requests`` session with optional headers and proxy."""
+def _stream_to_temp(
+    response: requests.Response,
+    directory: Path,
+    hasher=None,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+) -> Tuple[Path, int]:
+    """Write ``response`` chunk by chunk to a hidden ``.part`` file in ``directory``.
 
-    session = requests.Session()
-    session.headers["User-Agent"] = user_agent
-    if proxy_url:
-        session.proxies = {"http": proxy_url, "https": proxy_url}
-    return session
+    Returns the temporary path and the size; the file is removed on failure.
+    ``hasher`` (a ``hashlib`` object) is fed every chunk if given.
+    """
 
+    tmp_path = directory / f".{uuid.uuid4().hex}.part"
+    size = 0
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size):
+                f.write(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+                size += len(chunk)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path, size
 
-def save_images(img_elements, user_agent: str = DEFAULT_USER_AGENT, proxy_url: Optional[str] = None):
-    """Download the images to IMAGE_DIR."""
-    IMAGE_DIR.mkdir(exist_ok=True)
-    session = create_session(user_agent, proxy_url)
-    for idx, img in enumerate(img_elements, 1):
-        download_image(img, idx, session)
 
-def scrape_images(
-    url: str,
-    logger: Optional[logging.Logger] = None,
-    selector: str = DEFAULT_SELECTOR,
-    user_agent: str = DEFAULT_USER_AGENT,
-    proxy_url: Optional[str] = PROXY_URL,
-) -> None:
-    """Scrape product images from the given URL and save them locally."""
-    if logger is None:
-        logger = logging.getLogger(__name__)
+def _stream_to_file(
+    response: requests.Response,
+    target: Path,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+) -> int:
+    """Write ``response`` to ``target`` chunk by chunk and return its size.
 
-    logger.info("D\u00e9but du scraping pour %s", url)
-    driver = setup_driver(user_agent, proxy_url)
+    The body goes to a hidden ``.part`` file next to ``target`` which is renamed
+    once complete, so an interrupted download never appears under its final name.
+    """
+
+    tmp_path, size = _stream_to_temp(response, target.parent, chunk_size=chunk_size)
+    os.replace(tmp_path, target)
+    return size
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """Atomically hard link ``source`` as ``target``, or copy it if linking fails."""
+
+    if target.exists() and os.path.samefile(source, target):
+        return
+    tmp_path = target.with_name(f".{uuid.uuid4().hex}.part")
     try:
-        images = fetch_images(driver, url, selector)
-        if not images:
-            logger.info("Aucun \u00e9l\u00e9ment trouv\u00e9 avec le s\u00e9lecteur : %s", selector)
-            return
-        logger.info("\U0001F4C4 %d \u00e9l\u00e9ments trouv\u00e9s.", len(images))
+        os.link(source, tmp_path)
+    except OSError:
+        _copy_file(source, target)
+        return
+    try:
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
-        IMAGE_DIR.mkdir(exist_ok=True)
-        session = create_session(user_agent, proxy_url)
-        for idx, img in enumerate(images, 1):
-            download_image(img, idx, session, logger)
-    finally:
-        driver.quit()
-    logger.info(
-        "\u2705 Toutes les images ont \u00e9t\u00e9 enregistr\u00e9es dans le dossier %s",
-        IMAGE_DIR,
-    )
 
+def _copy_file(source: Path, target: Path) -> None:
+    """Atomically copy ``source`` to ``target`` unless they are the same file."""
 
-def main():
-    global IMAGE_DIR
+    if target.exists() and os.path.samefile(source, target):
+        return
+    tmp_path = target.with_name(f".{uuid.uuid4().hex}.part")
+    try:
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
-    parser = argparse.ArgumentParser(description="Scrape images from a product page")
-    parser.add_argument("url", help="URL de la page produit")
-    parser.add_argument(
-        "-s",
-        "--selector",
-        default=DEFAULT_SELECTOR,
-        help="Sélecteur CSS pour cibler les images (défaut: %(default)s)",
-    )
-    parser.add_argument(
-        "-o",
-        "--output-dir",
-        default=str(IMAGE_DIR),
-        help="Dossier de destination des images",
-    )
-    parser.add_argument(
+
+def download_images(
+    urls: Sequence[Optional[str]],
+    session: requests.Session,
+    logger: Optional[logging.Logger] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    output_dir: Optional[Path] = None,
+    store: Optional[BlobStore] = None,
+    http_cache: Optional[HttpCache] = None,
+    cancel_event: Optional[threading.Event] = None,
+    on_image: Optional[Callable[[ImageResult], None]] = None,
+    limiter: Optional[HostLimiter] = None,
+) -> List[ImageResult]:
+    """Download ``urls`` concurrently as ``image_1``, ``image_2``...
+
+    ``None`` entries keep their index but are skipped. One :class:`ImageResult`
+    is returned per entry. Files go to ``output_dir`` (``IMAGE_DIR`` by
+    default), or into ``store`` when content-addressed storage is used.
+    Unchanged images known to ``http_cache`` are not transferred again.
+    ``on_image`` is called from the worker threads with each finished result;
+    images not started yet are skipped once ``cancel_event`` is set. Pass a
+    shared ``limiter`` to apply ``per_host_limit`` across several calls.
+    """
+
+    if limiter is None:
+        limiter = HostLimiter(per_host_limit)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {}
+        for idx, src in enumerate(urls, 1):
+            if not src:
+                continue
+            futures[idx] = executor.submit(
+                _download_url,
+                src,
+                idx,
+                session,
+                logger,
+                limiter,
+                output_dir,
+                store,
+                http_cache,
+                cancel_event,
+            )
+            if on_image:
+                futures[idx].add_done_callback(lambda future: on_image(future.result()))
+    results = []
+    for idx in range(1, len(urls) + 1):
+        if idx in futures:
+            results.append(futures[idx].result())
+            continue
+        results.append(ImageResult(idx, None, error="aucune URL", status="skipped"))
+        if on_image:
+            on_image(results[-1])
+    return results
+
+
+class _Retry(Retry):
+    """``Retry`` that never sleeps longer than ``MAX_RETRY_AFTER`` for ``Retry-After``."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+def _retry_policy(retries: int, backoff_factor: float, backoff_jitter: float) -> Retry:
+    """Return the urllib3 retry policy used by :func:`create_session`.
+
+    Idempotent requests are retried on connection errors and on
+    ``RETRY_STATUSES`` with an exponential backoff, waiting for ``Retry-After``
+    when the server sends one. The last response is returned rather than
+    raised so callers keep handling errors with ``raise_for_status()``.
+    """
+
+    options = dict(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        return _Retry(backoff_jitter=backoff_jitter, **options)
+    except TypeError:
+        # urllib3 < 2 has no jitter: plain exponential backoff
+        return _Retry(**options)
+
+
+# TCP keep-alive of pooled connections: first probe after KEEPALIVE_IDLE idle
+# seconds, then every KEEPALIVE_INTERVAL seconds, KEEPALIVE_PROBES times. The
+# system default (two hours on Linux) is far above the few minutes after which
+# NAT gateways and proxies usually forget an idle connection
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_PROBES = 3
+
+
+def _keepalive_socket_options() -> List[Tuple[int, int, int]]:
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # TCP_KEEPIDLE on Linux and Windows, TCP_KEEPALIVE on macOS
+    idle = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)
+    if idle is not None:
+        options.append((socket.IPPROTO_TCP, idle, KEEPALIVE_IDLE))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL))
+    if hasattr(socket, "TCP_KEEPCNT"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, KEEPALIVE_PROBES))
+    return options
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """``HTTPAdapter`` enabling TCP keep-alive on its pooled connections.
+
+    Connections to a CDN stay idle between two products; probes sent after
+    ``KEEPALIVE_IDLE`` seconds stop NAT gateways and proxies from silently
+    dropping them (where the platform lets the delay be set).
+    """
+
+    socket_options = HTTPConnection.default_socket_options + _keepalive_socket_options()
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs["socket_options"] = self.socket_options
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+def create_session(
+    user_agent: str = DEFAULT_USER_AGENT,
+    proxy_url: Optional[str] = None,
+    pool_size: int = DEFAULT_MAX_WORKERS,
+    retries: int = DEFAULT_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    backoff_jitter: float = DEFAULT_BACKOFF_JITTER,
+) -> requests.Session:
+    """Return a ``requests`` session with optional headers and proxy.
+
+    Each host keeps up to ``pool_size`` connections alive (match it to the
+    number of download workers so none is opened and discarded per image),
+    and transient failures are retried ``retries`` times (see
+    :func:`_retry_policy`).
+    """
+
+    session = requests.Session()
+    session.headers["User-Agent"] = user_agent
+    if proxy_url:
+        session.proxies = {"http": proxy_url, "https": proxy_url}
+    adapter = _KeepAliveAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=_retry_policy(retries, backoff_factor, backoff_jitter),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class _Http2Response:
+    """Expose an ``httpx.Response`` through the ``requests`` API used here."""
+
+    def __init__(self, response):
+        self._response = response
+
+    @property
+    def status_code(self) -> int:
+        return self._response.status_code
+
+    @property
+    def headers(self):
+        return self._response.headers
+
+    @property
+    def url(self) -> str:
+        return str(self._response.url)
+
+    @property
+    def text(self) -> str:
+        return self._response.text
+
+    def json(self):
+        return self._response.json()
+
+    def raise_for_status(self) -> None:
+        # httpx also raises for 3xx answers, requests only for errors
+        if self._response.status_code >= 400:
+            self._response.raise_for_status()
+
+    def iter_content(self, chunk_size: int = DOWNLOAD_CHUNK_SIZE):
+        return self._response.iter_bytes(chunk_size)
+
+    def close(self) -> None:
+        self._response.close()
+
+    def __enter__(self) -> "_Http2Response":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class Http2Session:
+    """Download session multiplexing requests over HTTP/2 with ``httpx``.
+
+    It implements the part of ``requests.Session`` used by the download
+    pipeline, so all the images of a gallery served by one CDN host share a
+    single TLS connection. Requires ``httpx[http2]``.
+    """
+
+    def __init__(
+        self,
+        user_agent: str = DEFAULT_USER_AGENT,
+        proxy_url: Optional[str] = None,
+    ):
+        try:
+            import httpx
+
+            self._client = httpx.Client(
+                http2=True,
+                headers={"User-Agent": user_agent},
+                proxy=proxy_url,
+                follow_redirects=True,
+            )
+        except ImportError as e:
+            raise RuntimeError(
+                "Le client HTTP/2 n\u00e9cessite httpx : pip install 'httpx[http2]'"
+            ) from e
+        self.headers = self._client.headers
+
+    def get(
+        self,
+        url: str,
+        timeout: float = 30,
+        stream: bool = False,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> _Http2Response:
+        request = self._client.build_request(
+            "GET", url, headers=headers, timeout=timeout
+        )
+        return _Http2Response(self._client.send(request, stream=stream))
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def create_download_session(
+    client: str = DEFAULT_HTTP_CLIENT,
+    user_agent: str = DEFAULT_USER_AGENT,
+    proxy_url: Optional[str] = None,
+    **session_options,
+):
+    """Return the session used to download images with the given ``client``.
+
+    ``session_options`` (pool size, retry policy) are passed to
+    :func:`create_session` and ignored by the HTTP/2 client.
+    """
+
+    if client == "http2":
+        return Http2Session(user_agent, proxy_url)
+    if client == "requests":
+        return create_session(user_agent, proxy_url, **session_options)
+    raise ValueError(f"Client HTTP inconnu : {client}")
+
+
+def save_images(
+    img_elements,
+    user_agent: str = DEFAULT_USER_AGENT,
+    proxy_url: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+):
+    """Download the images to IMAGE_DIR."""
+    IMAGE_DIR.mkdir(exist_ok=True)
+    session = create_session(user_agent, proxy_url, pool_size=max_workers)
+    urls = []
+    if img_elements:
+        # WebElement.parent is the driver the elements were found with
+        urls = extract_image_urls(img_elements[0].parent, img_elements)
+    download_images(urls, session, max_workers=max_workers, per_host_limit=per_host_limit)
+
+
+def fetch_image_urls_http(
+    session: requests.Session,
+    url: str,
+    selector: str,
+    logger: Optional[logging.Logger] = None,
+) -> List[Optional[str]]:
+    """Return image URLs from the server-rendered HTML of ``url``, no browser."""
+
+    response = session.get(url, timeout=30)
+    response.raise_for_status()
+    soup = BeautifulSoup(response.text, HTML_PARSER)
+    urls = []
+    for idx, element in enumerate(soup.select(selector), 1):
+        src = _url_from_attributes(element.get, idx, logger)
+        urls.append(urljoin(response.url, src) if src else None)
+    return urls
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize ``url`` so that equivalent addresses compare equal.
+
+    ``//`` URLs get ``https:``, the host is lowercased, and the fragment and
+    cache-busting query parameters are dropped. The result is a comparison
+    key, not necessarily a URL the server answers the same way.
+    """
+
+    if url.startswith("//"):
+        url = "https:" + url
+    parts = urlsplit(url)
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in CACHE_BUSTING_PARAMS
+    ]
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), "")
+    )
+
+
+def _size_variant(url: str) -> Tuple[str, int]:
+    """Split ``url`` into a size-independent key and the size it asks for.
+
+    Sizes come from a CDN path suffix (``_800x``) or from size query
+    parameters. URLs without either are the original rendition and rank
+    highest.
+    """
+
+    parts = urlsplit(url)
+    sizes: List[int] = []
+    sized = False
+    path = parts.path
+    match = _SIZE_SUFFIX_RE.search(path)
+    if match:
+        width, height, height_only, scale = match.groups()
+        scale = int(scale or 1)
+        sizes += [
+            int(value) * scale for value in (width, height, height_only) if value
+        ]
+        path = path[: match.start()] + path[match.end():]
+        sized = True
+    query = []
+    for key, value in parse_qsl(parts.query, keep_blank_values=True):
+        if key.lower() in SIZE_PARAMS:
+            sizes += [int(value)] if value.isdigit() else []
+            sized = True
+        else:
+            query.append((key, value))
+    key = urlunsplit(parts._replace(path=path, query=urlencode(query)))
+    return key, max(sizes, default=0) if sized else sys.maxsize
+
+
+def dedupe_image_urls(
+    urls: Sequence[Optional[str]],
+    logger: Optional[logging.Logger] = None,
+) -> List[Optional[str]]:
+    """Keep a single entry per asset of ``urls``.
+
+    URLs are compared by their :func:`canonicalize_url` form but returned as
+    listed, only without fragment (``//`` URLs get ``https:``). When several size variants of the
+    same CDN image are listed, the largest one is kept at the position of the
+    first. ``None`` entries are preserved.
+    """
+
+    best: Dict[str, Tuple[int, str]] = {}
+    order: List[Optional[str]] = []
+    for url in urls:
+        if not url:
+            order.append(None)
+            continue
+        url = urldefrag(url)[0]
+        if url.startswith("//"):
+            url = "https:" + url
+        key, size = _size_variant(canonicalize_url(url))
+        if key not in best:
+            order.append(key)
+            best[key] = (size, url)
+        elif size > best[key][0]:
+            best[key] = (size, url)
+
+    duplicates = len(urls) - len(order)
+    if duplicates and logger:
+        logger.info("\U0001F501 %d doublon(s) ignor\u00e9(s)", duplicates)
+    return [best[key][1] if key else None for key in order]
+
+
+CdnResolver = Callable[[str, Optional[int]], Optional[str]]
+
+# Resolvers tried in order by resolve_cdn_url; extend with register_cdn_resolver
+CDN_RESOLVERS: List[CdnResolver] = []
+
+
+def register_cdn_resolver(resolver: CdnResolver) -> CdnResolver:
+    """Add ``resolver`` to :data:`CDN_RESOLVERS`; usable as a decorator.
+
+    A resolver receives a URL and the target width (``None`` for the largest
+    rendition) and returns the rewritten URL, or ``None`` if it does not
+    recognise the URL.
+    """
+
+    CDN_RESOLVERS.append(resolver)
+    return resolver
+
+
+def resolve_cdn_url(url: str, width: Optional[int] = TARGET_WIDTH) -> str:
+    """Rewrite ``url`` so the CDN serves it ``width`` pixels wide.
+
+    ``None`` asks for the largest rendition. URLs that no resolver recognises
+    are returned unchanged.
+    """
+
+    for resolver in CDN_RESOLVERS:
+        resolved = resolver(url, width)
+        if resolved:
+            return resolved
+    return url
+
+
+def _with_query(url: str, drop: Iterable[str], **params) -> str:
+    """Return ``url`` without the ``drop`` query parameters, plus ``params``."""
+
+    parts = urlsplit(url)
+    drop = {name.lower() for name in drop} | set(params)
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in drop
+    ]
+    query += [(key, str(value)) for key, value in params.items()]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _is_shopify_cdn(url: str) -> bool:
+    parts = urlsplit(url)
+    return parts.netloc.endswith("cdn.shopify.com") or parts.path.startswith("/cdn/shop/")
+
+
+@register_cdn_resolver
+def _resolve_width_template(url: str, width: Optional[int]) -> Optional[str]:
+    """Fill ``{width}`` templates found in lazy-loading markup."""
+
+    if "{width}" not in url:
+        return None
+    if width is None and _is_shopify_cdn(url):
+        # Without the size suffix Shopify serves the original upload
+        url = url.replace("_{width}x", "")
+    return url.replace("{width}", str(width or PLACEHOLDER_WIDTH))
+
+
+@register_cdn_resolver
+def _resolve_shopify(url: str, width: Optional[int]) -> Optional[str]:
+    """Ask Shopify's CDN for ``width`` pixels through its ``width`` parameter."""
+
+    if not _is_shopify_cdn(url):
+        return None
+    parts = urlsplit(url)
+    path = _SIZE_SUFFIX_RE.sub("", parts.path)
+    url = urlunsplit(parts._replace(path=path))
+    if width is None:
+        return _with_query(url, SIZE_PARAMS)
+    return _with_query(url, SIZE_PARAMS, width=width)
+
+
+@register_cdn_resolver
+def _resolve_width_param(url: str, width: Optional[int]) -> Optional[str]:
+    """Change the ``width``/``w`` parameter used by most resizing CDNs.
+
+    Without a target width the URL is left alone: some services reject
+    requests with no size.
+    """
+
+    if width is None:
+        return None
+    names = {key.lower() for key, _ in parse_qsl(urlsplit(url).query)}
+    for name in ("width", "w"):
+        if name in names:
+            return _with_query(url, ("height", "h"), **{name: width})
+    return None
+
+
+def shopify_product_json_url(url: str) -> Optional[str]:
+    """Return the ``/products/<handle>.js`` endpoint of a Shopify product URL."""
+
+    parsed = urlparse(url)
+    match = re.search(r"/products/([^/.]+)", parsed.path)
+    if not match:
+        return None
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path[:match.end()]}.js"
+
+
+def fetch_image_urls_shopify(session: requests.Session, url: str) -> List[Optional[str]]:
+    """Return every product image listed by the Shopify product JSON of ``url``.
+
+    Returns an empty list when ``url`` is not a product page; raises if the
+    endpoint does not answer with Shopify JSON.
+    """
+
+    endpoint = shopify_product_json_url(url)
+    if not endpoint:
+        return []
+    response = session.get(endpoint, timeout=30, headers={"Accept": "application/json"})
+    response.raise_for_status()
+    product = response.json()
+
+    sources = [
+        media.get("src")
+        for media in product.get("media") or []
+        if media.get("media_type", "image") == "image"
+    ]
+    if not any(sources):
+        sources = product.get("images") or []
+    return [urljoin(endpoint, src) for src in sources if src]
+
+
+def default_backends(selector: str = DEFAULT_SELECTOR) -> Tuple[str, ...]:
+    """Return the backends tried when none are chosen for ``selector``.
+
+    A custom selector must be honoured, which the Shopify JSON cannot do.
+    """
+
+    return DEFAULT_BACKENDS if selector == DEFAULT_SELECTOR else SELECTOR_BACKENDS
+
+
+def collect_image_urls(
+    url: str,
+    selector: str = DEFAULT_SELECTOR,
+    session: Optional[requests.Session] = None,
+    logger: Optional[logging.Logger] = None,
+    backends: Optional[Sequence[str]] = None,
+    pool: Optional[DriverPool] = None,
+    wait_strategy: str = DEFAULT_WAIT_STRATEGY,
+    wait_script: Optional[str] = None,
+    delay: Tuple[float, float] = DEFAULT_DELAY,
+    lazy_load: bool = DEFAULT_LAZY_LOAD,
+    **driver_options,
+) -> List[Optional[str]]:
+    """Return the image URLs of ``url`` using the first backend that finds any.
+
+    ``"shopify"`` reads the product JSON endpoint and ignores ``selector``;
+    ``"http"`` parses the HTML returned by ``session``; ``"browser"`` loads the
+    page in Chrome (borrowed from ``pool`` if given, otherwise started with
+    ``driver_options``), scrolling lazy galleries when ``lazy_load`` is set.
+    Without ``backends``, see :func:`default_backends`.
+    """
+
+    if backends is None:
+        backends = default_backends(selector)
+    unknown = set(backends) - set(BACKENDS)
+    if unknown:
+        raise ValueError(f"Source inconnue : {', '.join(sorted(unknown))}")
+    if logger is None:
+        logger = logging.getLogger(__name__)
+    if "shopify" in backends and selector != DEFAULT_SELECTOR:
+        logger.warning(
+            "Source shopify : le s\u00e9lecteur %r est ignor\u00e9 si le JSON du produit r\u00e9pond",
+            selector,
+        )
+    if session is None:
+        session = create_session()
+
+    for backend in backends:
+        urls: List[Optional[str]] = []
+        if backend == "shopify":
+            try:
+                urls = fetch_image_urls_shopify(session, url)
+            except Exception as e:
+                logger.info("Pas de JSON Shopify pour %s : %s", url, e)
+        elif backend == "http":
+            try:
+                urls = fetch_image_urls_http(session, url, selector, logger)
+            except Exception as e:
+                logger.warning("R\u00e9cup\u00e9ration HTTP impossible pour %s : %s", url, e)
+        else:
+            with _borrow_driver(pool, **driver_options) as driver:
+                images = fetch_images(
+                    driver,
+                    url,
+                    selector,
+                    wait_strategy,
+                    delay=delay,
+                    script=wait_script,
+                    lazy_load=lazy_load,
+                )
+                urls = extract_image_urls(driver, images, logger)
+        if any(urls):
+            logger.info(
+                "\U0001F4C4 %d \u00e9l\u00e9ments trouv\u00e9s (%s).", len(urls), backend
+            )
+            return urls
+    return []
+
+
+# Phase names of ScrapeResult.timings as shown by describe()
+_PHASE_LABELS = {
+    "collect": "collecte",
+    "download": "t\u00e9l\u00e9chargement",
+    "save": "enregistrement",
+}
+
+
+@dataclass
+class ScrapeResult:
+    """Outcome of scraping one product page.
+
+    ``images`` holds one :class:`ImageResult` per collected URL and
+    ``timings`` the seconds spent in each phase: ``"collect"`` (finding the
+    image URLs), ``"download"`` and ``"save"`` (manifest and HTTP cache).
+    """
+
+    url: str
+    output_dir: Path
+    found: int = 0
+    downloaded: int = 0
+    bytes: int = 0
+    duration: float = 0.0
+    error: Optional[str] = None
+    images: List[ImageResult] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def failed(self) -> int:
+        """Images whose download failed."""
+
+        return sum(1 for image in self.images if image.status == "failed")
+
+    @property
+    def skipped(self) -> int:
+        """Matched elements without a usable URL (not counted as failures)."""
+
+        return sum(1 for image in self.images if image.status == "skipped")
+
+    def set_images(self, images: List[ImageResult]) -> None:
+        """Record the downloaded ``images`` and update the counters."""
+
+        self.images = images
+        self.found = len(images)
+        self.downloaded = sum(1 for image in images if image.path)
+        self.bytes = sum(image.bytes for image in images)
+
+    def describe(self) -> str:
+        """Return a one-line human readable summary."""
+
+        status = "\u2705" if not self.error and not self.failed else "\u26A0\uFE0F"
+        line = (
+            f"{status} {self.url} : {self.downloaded}/{self.found} images, "
+            f"{self.bytes / 1024:.0f} Ko, {self.duration:.2f}s"
+        )
+        phases = [
+            f"{label} {self.timings[name]:.2f}s"
+            for name, label in _PHASE_LABELS.items()
+            if name in self.timings
+        ]
+        if phases:
+            line += f" ({', '.join(phases)})"
+        if self.skipped:
+            line += f", {self.skipped} ignor\u00e9e(s)"
+        if self.error:
+            line += f", erreur : {self.error}"
+        return line
+
+
+def scrape_images(
+    url: str,
+    logger: Optional[logging.Logger] = None,
+    selector: str = DEFAULT_SELECTOR,
+    user_agent: str = DEFAULT_USER_AGENT,
+    proxy_url: Optional[str] = PROXY_URL,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    pool: Optional[DriverPool] = None,
+    driver_path: Optional[str] = CHROMEDRIVER_PATH,
+    offline: bool = OFFLINE,
+    block: str = DEFAULT_BLOCK_PROFILE,
+    output_dir: Optional[Path] = None,
+    wait_strategy: str = DEFAULT_WAIT_STRATEGY,
+    wait_script: Optional[str] = None,
+    delay: Tuple[float, float] = DEFAULT_DELAY,
+    lazy_load: bool = DEFAULT_LAZY_LOAD,
+    backends: Optional[Sequence[str]] = None,
+    store: Optional[BlobStore] = None,
+    http_cache: Optional[HttpCache] = None,
+    target_width: Optional[int] = TARGET_WIDTH,
+    http_client: str = DEFAULT_HTTP_CLIENT,
+    retries: int = DEFAULT_RETRIES,
+    session: Optional[requests.Session] = None,
+    cancel_event: Optional[threading.Event] = None,
+    on_image: Optional[Callable[[ImageResult], None]] = None,
+    limiter: Optional[HostLimiter] = None,
+) -> ScrapeResult:
+    """Scrape product images from the given URL and save them locally.
+
+    ``backends`` are tried in order (see :func:`collect_image_urls`), so Chrome
+    is only started when the HTML alone does not contain the gallery. When
+    ``pool`` is given the browser is borrowed from it instead of being started
+    and quit for this page only. Images are written to ``output_dir``
+    (``IMAGE_DIR`` by default); with a ``store`` they are deduplicated in it and
+    ``output_dir`` only receives a manifest. ``http_cache`` turns downloads into
+    conditional requests; it is saved periodically and the caller should call
+    its ``save()`` method once done. Known CDN URLs are rewritten to
+    ``target_width`` pixels (the largest rendition when ``None``).
+    ``http_client`` selects the download client (see
+    :func:`create_download_session`); with ``requests`` each failed request is
+    retried up to ``retries`` times with a jittered exponential backoff.
+    A ``session`` and a ``limiter`` may be passed to reuse connections and
+    share the per-host limit across pages.
+    Setting ``cancel_event`` stops the scrape before the next download and
+    ``on_image`` is called with each image as it completes (see
+    :func:`download_images`).
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+    output_dir = Path(output_dir) if output_dir else IMAGE_DIR
+    result = ScrapeResult(url, output_dir)
+    start = time.perf_counter()
+
+    logger.info("D\u00e9but du scraping pour %s", url)
+    if session is None:
+        session = create_session(user_agent, proxy_url, pool_size=max_workers, retries=retries)
+    urls = collect_image_urls(
+        url,
+        selector,
+        session,
+        logger,
+        backends=backends,
+        pool=pool,
+        wait_strategy=wait_strategy,
+        wait_script=wait_script,
+        delay=delay,
+        lazy_load=lazy_load,
+        user_agent=user_agent,
+        proxy_url=proxy_url,
+        driver_path=driver_path,
+        offline=offline,
+        block=block,
+    )
+    result.timings["collect"] = time.perf_counter() - start
+    if not urls:
+        logger.info("Aucun \u00e9l\u00e9ment trouv\u00e9 avec le s\u00e9lecteur : %s", selector)
+        result.duration = time.perf_counter() - start
+        return result
+    if cancel_event is not None and cancel_event.is_set():
+        result.error = "annul\u00e9"
+        result.duration = time.perf_counter() - start
+        return result
+    urls = _prepare_download_urls(urls, logger, target_width)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    phase = time.perf_counter()
+    if http_client != "requests":
+        session = create_download_session(http_client, user_agent, proxy_url)
+    try:
+        images = download_images(
+            urls,
+            session,
+            logger,
+            max_workers,
+            per_host_limit,
+            output_dir,
+            store,
+            http_cache,
+            cancel_event,
+            on_image,
+            limiter,
+        )
+    finally:
+        if http_client != "requests":
+            session.close()
+    result.timings["download"] = time.perf_counter() - phase
+    phase = time.perf_counter()
+    if store:
+        store.write_manifest(output_dir, url, images)
+    if http_cache:
+        http_cache.flush()
+    result.timings["save"] = time.perf_counter() - phase
+    result.set_images(images)
+    if cancel_event is not None and cancel_event.is_set():
+        result.error = "annul\u00e9"
+    result.duration = time.perf_counter() - start
+    logger.info(
+        "\u2705 Toutes les images ont \u00e9t\u00e9 enregistr\u00e9es dans le dossier %s",
+        output_dir,
+    )
+    return result
+
+
+def _prepare_download_urls(
+    urls: Sequence[Optional[str]],
+    logger: Optional[logging.Logger],
+    target_width: Optional[int],
+) -> List[Optional[str]]:
+    """Deduplicate collected ``urls`` and rewrite CDN URLs to ``target_width``."""
+
+    urls = dedupe_image_urls(urls, logger)
+    return [resolve_cdn_url(src, target_width) if src else None for src in urls]
+
+
+def product_dir_name(url: str) -> str:
+    """Return a folder name unique to the product page at ``url``.
+
+    The host and the last path segment keep it readable; a short hash of the
+    canonical URL tells apart variants (``?variant=``) and equal handles on
+    other sites, e.g. ``shop.com_bob-ficelle_1a2b3c4d``.
+    """
+
+    parsed = urlparse(url)
+    segments = [part for part in parsed.path.split("/") if part]
+    parts = [parsed.hostname or "", segments[-1] if segments else ""]
+    name = "_".join(
+        re.sub(r"[^\w.-]+", "-", part).strip(".-") for part in parts if part
+    )
+    digest = hashlib.sha1(canonicalize_url(url).encode("utf-8")).hexdigest()[:8]
+    return f"{name or 'produit'}_{digest}"
+
+
+def read_urls(stream: TextIO) -> Iterator[str]:
+    """Yield one URL per line of ``stream``, skipping blanks and ``#`` comments.
+
+    A page listed twice is only yielded once: both would write to the same
+    :func:`product_dir_name` folder.
+    """
+
+    seen = set()
+    for line in stream:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        canonical = canonicalize_url(line)
+        if canonical not in seen:
+            seen.add(canonical)
+            yield line
+
+
+def scrape_batch(
+    urls: Iterable[str],
+    browsers: int = DEFAULT_POOL_SIZE,
+    output_dir: Optional[Path] = None,
+    logger: Optional[logging.Logger] = None,
+    user_agent: str = DEFAULT_USER_AGENT,
+    proxy_url: Optional[str] = PROXY_URL,
+    driver_path: Optional[str] = CHROMEDRIVER_PATH,
+    offline: bool = OFFLINE,
+    block: str = DEFAULT_BLOCK_PROFILE,
+    **scrape_options,
+) -> Iterator[ScrapeResult]:
+    """Scrape many product pages with ``browsers`` Chrome instances in parallel.
+
+    Each product is saved in its own sub-directory of ``output_dir`` and its
+    :class:`ScrapeResult` is yielded as soon as it is done. Only a couple of
+    pages per browser are queued at a time, so ``urls`` may be a long stream.
+    Remaining keyword arguments are passed to :func:`scrape_images`; every page
+    shares one session and one per-host limit.
+    """
+
+    if logger is None:
+        logger = logging.getLogger(__name__)
+    root = Path(output_dir) if output_dir else IMAGE_DIR
+    browsers = max(1, browsers)
+    pool = DriverPool(
+        browsers,
+        user_agent=user_agent,
+        proxy_url=proxy_url,
+        driver_path=driver_path,
+        offline=offline,
+        block=block,
+    )
+    max_workers = max(1, scrape_options.get("max_workers", DEFAULT_MAX_WORKERS))
+    session = create_session(
+        user_agent,
+        proxy_url,
+        pool_size=browsers * max_workers,
+        retries=scrape_options.get("retries", DEFAULT_RETRIES),
+    )
+    limiter = HostLimiter(scrape_options.get("per_host_limit", DEFAULT_PER_HOST_LIMIT))
+
+    def scrape_one(url: str) -> ScrapeResult:
+        product_dir = root / product_dir_name(url)
+        try:
+            return scrape_images(
+                url,
+                logger,
+                user_agent=user_agent,
+                proxy_url=proxy_url,
+                pool=pool,
+                output_dir=product_dir,
+                session=session,
+                limiter=limiter,
+                **scrape_options,
+            )
+        except Exception as e:
+            logger.error("\u26A0\uFE0F Erreur scraping %s: %s", url, e)
+            return ScrapeResult(url, product_dir, error=str(e))
+
+    with pool, session, ThreadPoolExecutor(max_workers=browsers) as executor:
+        pending = set()
+        for url in urls:
+            pending.add(executor.submit(scrape_one, url))
+            if len(pending) >= 2 * browsers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in as_completed(pending):
+            yield future.result()
+
+
+# State of a scrape_batch_processes worker: its logger, browser and session
+_worker: Dict[str, object] = {}
+
+
+def _init_worker(log_queue, level: int, driver_options: dict, session_options: dict) -> None:
+    """Set up a worker process of :func:`scrape_batch_processes`.
+
+    Records are sent to the parent through ``log_queue``. The browser (a
+    one-driver :class:`DriverPool`, so it is health-checked and recycled) is
+    started with the first page and quit when the process exits.
+    """
+
+    logger = logging.getLogger(f"{__name__}.worker")
+    logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    logger.setLevel(level)
+    logger.propagate = False
+    pool = DriverPool(1, **driver_options)
+    multiprocessing.util.Finalize(pool, pool.close, exitpriority=10)
+    _worker.update(
+        logger=logger,
+        pool=pool,
+        session=create_session(
+            driver_options["user_agent"], driver_options["proxy_url"], **session_options
+        ),
+    )
+
+
+def _scrape_in_worker(url: str, output_dir: Path, scrape_options: dict) -> ScrapeResult:
+    """Scrape ``url`` into ``output_dir`` with the browser and session of this worker."""
+
+    logger = _worker["logger"]
+    try:
+        return scrape_images(
+            url,
+            logger,
+            pool=_worker["pool"],
+            session=_worker["session"],
+            output_dir=output_dir,
+            **scrape_options,
+        )
+    except Exception as e:
+        logger.error("\u26A0\uFE0F Erreur scraping %s: %s", url, e)
+        return ScrapeResult(url, output_dir, error=str(e))
+
+
+class _LoggerHandler(logging.Handler):
+    """Pass records received from worker processes on to ``logger``."""
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__()
+        self.logger = logger
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.logger.handle(record)
+
+
+def scrape_batch_processes(
+    urls: Iterable[str],
+    processes: int = DEFAULT_POOL_SIZE,
+    output_dir: Optional[Path] = None,
+    logger: Optional[logging.Logger] = None,
+    user_agent: str = DEFAULT_USER_AGENT,
+    proxy_url: Optional[str] = PROXY_URL,
+    driver_path: Optional[str] = CHROMEDRIVER_PATH,
+    offline: bool = OFFLINE,
+    block: str = DEFAULT_BLOCK_PROFILE,
+    **scrape_options,
+) -> Iterator[ScrapeResult]:
+    """Scrape many product pages in ``processes`` worker processes.
+
+    Like :func:`scrape_batch`, but each worker process drives its own Chrome
+    and owns its own download session, so Selenium and image processing of
+    one page never wait on the GIL held by another. Worker logs are forwarded
+    to ``logger`` and results are yielded as pages finish. ``http_cache`` is
+    not supported: its entries live in the memory of a single process.
+    """
+
+    if scrape_options.get("http_cache"):
+        raise ValueError("Le cache HTTP n'est pas partag\u00e9 entre processus")
+    scrape_options.pop("http_cache", None)
+    if logger is None:
+        logger = logging.getLogger(__name__)
+    root = Path(output_dir) if output_dir else IMAGE_DIR
+    processes = max(1, processes)
+    driver_options = dict(
+        user_agent=user_agent,
+        proxy_url=proxy_url,
+        driver_path=driver_path,
+        offline=offline,
+        block=block,
+    )
+    session_options = dict(
+        pool_size=scrape_options.get("max_workers", DEFAULT_MAX_WORKERS),
+        retries=scrape_options.get("retries", DEFAULT_RETRIES),
+    )
+    scrape_options.update(user_agent=user_agent, proxy_url=proxy_url)
+
+    # spawn: workers must not inherit the parent's threads and open browsers
+    context = multiprocessing.get_context("spawn")
+    log_queue = context.Queue()
+    listener = logging.handlers.QueueListener(log_queue, _LoggerHandler(logger))
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(log_queue, logger.getEffectiveLevel(), driver_options, session_options),
+        ) as executor:
+            pending = set()
+            for url in urls:
+                product_dir = root / product_dir_name(url)
+                pending.add(executor.submit(_scrape_in_worker, url, product_dir, scrape_options))
+                if len(pending) >= 2 * processes:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in as_completed(pending):
+                yield future.result()
+    finally:
+        listener.stop()
+
+
+class _AsyncProduct:
+    """Progress of one product page through :func:`scrape_images_async`."""
+
+    def __init__(self, url: str, output_dir: Path):
+        self.result = ScrapeResult(url, output_dir)
+        self.start = self.collected = time.perf_counter()
+        self.images: List[ImageResult] = []
+        self.pending = 0
+
+    def collect_done(self) -> None:
+        self.collected = time.perf_counter()
+        self.result.timings["collect"] = self.collected - self.start
+
+    def finish(self, store: Optional[BlobStore], http_cache: Optional[HttpCache]) -> ScrapeResult:
+        """Write the manifest, flush the cache and fill in the result counters."""
+
+        result = self.result
+        phase = time.perf_counter()
+        result.timings["download"] = phase - self.collected
+        images = sorted(self.images, key=lambda image: image.index)
+        if store and images:
+            store.write_manifest(result.output_dir, result.url, images)
+        if http_cache:
+            http_cache.flush()
+        result.timings["save"] = time.perf_counter() - phase
+        result.set_images(images)
+        result.duration = time.perf_counter() - self.start
+        return result
+
+
+async def scrape_images_async(
+    urls: Iterable[str],
+    browsers: int = DEFAULT_POOL_SIZE,
+    output_dir: Optional[Path] = None,
+    logger: Optional[logging.Logger] = None,
+    selector: str = DEFAULT_SELECTOR,
+    user_agent: str = DEFAULT_USER_AGENT,
+    proxy_url: Optional[str] = PROXY_URL,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    pages: int = DEFAULT_PAGE_CONCURRENCY,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    driver_path: Optional[str] = CHROMEDRIVER_PATH,
+    offline: bool = OFFLINE,
+    block: str = DEFAULT_BLOCK_PROFILE,
+    wait_strategy: str = DEFAULT_WAIT_STRATEGY,
+    wait_script: Optional[str] = None,
+    delay: Tuple[float, float] = DEFAULT_DELAY,
+    lazy_load: bool = DEFAULT_LAZY_LOAD,
+    backends: Optional[Sequence[str]] = None,
+    store: Optional[BlobStore] = None,
+    http_cache: Optional[HttpCache] = None,
+    target_width: Optional[int] = TARGET_WIDTH,
+    http_client: str = DEFAULT_HTTP_CLIENT,
+    retries: int = DEFAULT_RETRIES,
+) -> AsyncIterator[ScrapeResult]:
+    """Scrape many product pages as a pipeline and yield each :class:`ScrapeResult`.
+
+    Page loading (``pages`` at a time, sharing ``browsers`` Chrome instances)
+    and image downloads (``max_workers`` at a time) are separate stages
+    connected by bounded queues: the images of a product are downloaded while
+    the next pages are loaded, and a stage that falls behind suspends the one
+    feeding it, so ``urls`` may be an arbitrarily long stream. Selenium and
+    ``requests`` are blocking, so each stage runs them in its own thread pool.
+    Options have the same meaning as for :func:`scrape_batch`.
+    """
+
+    if logger is None:
+        logger = logging.getLogger(__name__)
+    root = Path(output_dir) if output_dir else IMAGE_DIR
+    pages = max(1, pages)
+    max_workers = max(1, max_workers)
+    loop = asyncio.get_running_loop()
+    # ``urls`` may block (e.g. lines read from stdin): it is pulled from its own
+    # thread so the pipeline keeps running while the next URL is awaited
+    url_executor = ThreadPoolExecutor(max_workers=1)
+    page_executor = ThreadPoolExecutor(max_workers=pages)
+    download_executor = ThreadPoolExecutor(max_workers=max_workers)
+    pool = DriverPool(
+        max(1, browsers),
+        user_agent=user_agent,
+        proxy_url=proxy_url,
+        driver_path=driver_path,
+        offline=offline,
+        block=block,
+    )
+    # Shared by both stages: page fetches and downloads
+    session = create_session(
+        user_agent, proxy_url, pool_size=pages + max_workers, retries=retries
+    )
+    download_session = session
+    if http_client != "requests":
+        download_session = create_download_session(http_client, user_agent, proxy_url)
+    limiter = HostLimiter(per_host_limit)
+
+    page_queue: asyncio.Queue = asyncio.Queue(maxsize=2 * pages)
+    download_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+    results: asyncio.Queue = asyncio.Queue(maxsize=2 * pages)
+
+    def collect(url: str) -> List[Optional[str]]:
+        logger.info("D\u00e9but du scraping pour %s", url)
+        found = collect_image_urls(
+            url,
+            selector,
+            session,
+            logger,
+            backends=backends,
+            pool=pool,
+            wait_strategy=wait_strategy,
+            wait_script=wait_script,
+            delay=delay,
+            lazy_load=lazy_load,
+        )
+        return _prepare_download_urls(found, logger, target_width)
+
+    async def finish(product: _AsyncProduct) -> None:
+        result = await loop.run_in_executor(download_executor, product.finish, store, http_cache)
+        await results.put(result)
+
+    async def feed() -> None:
+        it = iter(urls)
+        while True:
+            url = await loop.run_in_executor(url_executor, next, it, None)
+            if url is None:
+                break
+            await page_queue.put(url)
+        for _ in range(pages):
+            await page_queue.put(None)
+
+    async def load_pages() -> None:
+        while True:
+            url = await page_queue.get()
+            if url is None:
+                return
+            product = _AsyncProduct(url, root / product_dir_name(url))
+            try:
+                found = await loop.run_in_executor(page_executor, collect, url)
+            except Exception as e:
+                logger.error("\u26A0\uFE0F Erreur scraping %s: %s", url, e)
+                product.result.error = str(e)
+                found = []
+            product.collect_done()
+            if not found and not product.result.error:
+                logger.info("Aucun \u00e9l\u00e9ment trouv\u00e9 avec le s\u00e9lecteur : %s", selector)
+            if found:
+                product.result.output_dir.mkdir(parents=True, exist_ok=True)
+            product.pending = len(found)
+            if not found:
+                await finish(product)
+            for index, src in enumerate(found, 1):
+                await download_queue.put((product, index, src))
+
+    async def download() -> None:
+        while True:
+            item = await download_queue.get()
+            if item is None:
+                return
+            product, index, src = item
+            if src:
+                image = await loop.run_in_executor(
+                    download_executor,
+                    _download_url,
+                    src,
+                    index,
+                    download_session,
+                    logger,
+                    limiter,
+                    product.result.output_dir,
+                    store,
+                    http_cache,
+                )
+            else:
+                image = ImageResult(index, None, error="aucune URL", status="skipped")
+            product.images.append(image)
+            product.pending -= 1
+            if not product.pending:
+                await finish(product)
+
+    async def run() -> None:
+        loaders = [asyncio.ensure_future(feed())]
+        loaders += [asyncio.ensure_future(load_pages()) for _ in range(pages)]
+        downloaders = [asyncio.ensure_future(download()) for _ in range(max_workers)]
+        try:
+            await asyncio.gather(*loaders)
+            for _ in downloaders:
+                await download_queue.put(None)
+            await asyncio.gather(*downloaders)
+        finally:
+            for task in loaders + downloaders:
+                task.cancel()
+            await asyncio.gather(*loaders, *downloaders, return_exceptions=True)
+
+    pipeline = asyncio.ensure_future(run())
+    try:
+        while not (pipeline.done() and results.empty()):
+            getter = asyncio.ensure_future(results.get())
+            await asyncio.wait({getter, pipeline}, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                yield getter.result()
+            else:
+                getter.cancel()
+        # Raise the error that stopped the pipeline, if any
+        pipeline.result()
+    finally:
+        pipeline.cancel()
+        await asyncio.gather(pipeline, return_exceptions=True)
+        # Not waited for: it may be stuck reading a stream nobody will end
+        url_executor.shutdown(wait=False)
+        page_executor.shutdown(wait=True)
+        download_executor.shutdown(wait=True)
+        pool.close()
+        if download_session is not session:
+            download_session.close()
+        session.close()
+
+
+def _iterate_async(results: AsyncIterator[ScrapeResult]) -> Iterator[ScrapeResult]:
+    """Drive the async generator ``results`` from synchronous code."""
+
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(results.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        loop.run_until_complete(results.aclose())
+        loop.close()
+
+
+def _scrape_options(args: argparse.Namespace) -> dict:
+    """Translate parsed CLI arguments into ``scrape_images`` keyword arguments."""
+
+    return dict(
+        selector=args.selector,
+        user_agent=args.user_agent,
+        proxy_url=args.proxy,
+        driver_path=args.driver_path,
+        offline=args.offline,
+        block=args.block,
+        max_workers=args.workers,
+        per_host_limit=args.per_host,
+        wait_strategy=args.wait,
+        wait_script=args.wait_script,
+        delay=tuple(args.delay),
+        lazy_load=args.lazy_load,
+        backends=tuple(args.backend) if args.backend else None,
+        store=BlobStore(args.store) if args.store else None,
+        http_cache=HttpCache(args.http_cache) if args.http_cache else None,
+        target_width=args.target_width,
+        http_client=args.http_client,
+        retries=args.retries,
+    )
+
+
+def _run_batch(args: argparse.Namespace, options: dict) -> None:
+    """Run ``scrape_batch`` for the CLI and print one summary line per URL."""
+
+    with ExitStack() as stack:
+        if args.input == "-":
+            stream = sys.stdin
+        else:
+            stream = stack.enter_context(open(args.input, encoding="utf-8"))
+        summary = None
+        if args.summary:
+            summary = stack.enter_context(open(args.summary, "w", encoding="utf-8"))
+
+        pages = images = total_bytes = errors = skipped = 0
+        start = time.perf_counter()
+        if args.engine == "processes":
+            results = scrape_batch_processes(read_urls(stream), args.browsers, IMAGE_DIR, **options)
+        elif args.engine == "async":
+            results = _iterate_async(
+                scrape_images_async(read_urls(stream), args.browsers, IMAGE_DIR, **options)
+            )
+        else:
+            results = scrape_batch(read_urls(stream), args.browsers, IMAGE_DIR, **options)
+        for result in results:
+            print(result.describe())
+            if summary:
+                summary.write(json.dumps(asdict(result), default=str) + "\n")
+                summary.flush()
+            pages += 1
+            images += result.downloaded
+            total_bytes += result.bytes
+            errors += result.failed + (1 if result.error else 0)
+            skipped += result.skipped
+
+    print(
+        f"\U0001F4CA {pages} pages, {images} images, {total_bytes / 1024 / 1024:.1f} Mo, "
+        f"{errors} erreurs, {skipped} ignor\u00e9es en {time.perf_counter() - start:.1f}s"
+    )
+
+
+def main():
+    global IMAGE_DIR
+
+    parser = argparse.ArgumentParser(description="Scrape images from a product page")
+    parser.add_argument("url", nargs="?", help="URL de la page produit")
+    parser.add_argument(
+        "-i",
+        "--input",
+        help="Fichier listant une URL par ligne ('-' pour l'entrée standard)",
+    )
+    parser.add_argument(
+        "-b",
+        "--browsers",
+        type=int,
+        default=DEFAULT_POOL_SIZE,
+        help="Navigateurs en parallèle en mode lot (défaut: %(default)s)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="threads",
+        help="Moteur du mode lot : async télécharge les images pendant le "
+        "chargement des pages suivantes, processes lance un processus par "
+        "navigateur (défaut: %(default)s)",
+    )
+    parser.add_argument(
+        "--summary",
+        help="Fichier JSON Lines recevant le bilan de chaque URL (mode lot)",
+    )
+    parser.add_argument(
+        "-s",
+        "--selector",
+        default=DEFAULT_SELECTOR,
+        help="Sélecteur CSS pour cibler les images (défaut: %(default)s)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        default=str(IMAGE_DIR),
+        help="Dossier de destination des images",
+    )
+    parser.add_argument(
+        "--target-width",
+        type=int,
+        default=TARGET_WIDTH,
+        help="Largeur demandée aux CDN qui redimensionnent (défaut : la plus grande)",
+    )
+    parser.add_argument(
+        "--store",
+        default=BLOB_STORE_DIR,
+        help="Dossier de stockage dédupliqué : chaque image distincte n'y est "
+        "écrite qu'une fois et chaque produit reçoit un manifest.json",
+    )
+    parser.add_argument(
+        "--http-cache",
+        default=HTTP_CACHE_FILE,
+        help="Fichier de cache HTTP : les images inchangées (ETag/Last-Modified) "
+        "ne sont pas retéléchargées",
+    )
+    parser.add_argument(
         "-u",
         "--user-agent",
         default=DEFAULT_USER_AGENT,
@@ -273,21 +2642,103 @@ def main():
         default=PROXY_URL,
         help="URL du proxy à utiliser",
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help="Nombre de téléchargements simultanés (défaut: %(default)s)",
+    )
+    parser.add_argument(
+        "--http-client",
+        choices=HTTP_CLIENTS,
+        default=DEFAULT_HTTP_CLIENT,
+        help="Client de téléchargement, http2 multiplexe les images sur une "
+        "seule connexion (défaut: %(default)s)",
+    )
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        default=DEFAULT_PER_HOST_LIMIT,
+        help="Téléchargements simultanés maximum par hôte (défaut: %(default)s)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=DEFAULT_RETRIES,
+        help="Nouvelles tentatives après une erreur réseau ou un code 429/5xx, "
+        "avec attente exponentielle (défaut: %(default)s)",
+    )
+    parser.add_argument(
+        "--backend",
+        action="append",
+        choices=BACKENDS,
+        help="Source des URLs d'images, répétable et essayée dans l'ordre "
+        f"(défaut: {' '.join(DEFAULT_BACKENDS)}, sans shopify avec un "
+        "--selector personnalisé)",
+    )
+    parser.add_argument(
+        "--wait",
+        choices=WAIT_STRATEGIES,
+        default=DEFAULT_WAIT_STRATEGY,
+        help="Condition indiquant que la page est prête (défaut: %(default)s)",
+    )
+    parser.add_argument(
+        "--wait-script",
+        help="Expression JavaScript attendue avec --wait script",
+    )
+    parser.add_argument(
+        "--delay",
+        nargs=2,
+        type=float,
+        metavar=("MIN", "MAX"),
+        default=DEFAULT_DELAY,
+        help="Pause aléatoire (secondes) après le chargement de la page",
+    )
+    parser.add_argument(
+        "--lazy-load",
+        action="store_true",
+        default=DEFAULT_LAZY_LOAD,
+        help="Faire défiler la galerie jusqu'à ce que les images en lazy-loading "
+        "soient toutes chargées",
+    )
+    parser.add_argument(
+        "--driver-path",
+        default=CHROMEDRIVER_PATH,
+        help="Chemin d'un chromedriver déjà installé (aucun téléchargement)",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        default=OFFLINE,
+        help="Ne jamais contacter le réseau pour résoudre chromedriver",
+    )
+    parser.add_argument(
+        "--block",
+        choices=list(BLOCK_PROFILES),
+        default=DEFAULT_BLOCK_PROFILE,
+        help="Requêtes bloquées dans Chrome : media (vidéos, polices, traqueurs), "
+        "aggressive (aussi les images) ou none (défaut: %(default)s)",
+    )
     args = parser.parse_args()
+    if not args.url and not args.input:
+        parser.error("indiquez une URL ou un fichier d'URLs avec --input")
+    if args.engine == "processes" and args.http_cache:
+        parser.error("--http-cache n'est pas disponible avec --engine processes")
 
     IMAGE_DIR = Path(args.output_dir)
-
-    driver = setup_driver(args.user_agent, args.proxy)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # httpx logs every request at INFO level.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    options = _scrape_options(args)
     try:
-        images = fetch_images(driver, args.url, args.selector)
-        if not images:
-            print(f"Aucun élément trouvé avec le sélecteur : {args.selector}")
-            return
-        print(f"\U0001F4F8 {len(images)} images trouvées.")
-        save_images(images, args.user_agent, args.proxy)
+        if args.input:
+            _run_batch(args, options)
+        else:
+            print(scrape_images(args.url, output_dir=IMAGE_DIR, **options).describe())
     finally:
-        driver.quit()
-    print(f"\u2705 Toutes les images ont été enregistrées dans le dossier {IMAGE_DIR}")
+        if options["http_cache"]:
+            options["http_cache"].save()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+import threading
+
+import pytest
+
+import scrape_images
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+
+    def execute_script(self, script):
+        return 1
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def fake_drivers(monkeypatch):
+    started = []
+
+    def setup_driver(**options):
+        driver = FakeDriver()
+        started.append(driver)
+        return driver
+
+    monkeypatch.setattr(scrape_images, "setup_driver", setup_driver)
+    return started
+
+
+def test_waiter_wakes_up_when_borrowed_driver_is_recycled(fake_drivers):
+    pool = scrape_images.DriverPool(1, max_pages=1)
+    first = pool.acquire()
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()), daemon=True)
+    waiter.start()
+    waiter.join(0.2)
+    assert waiter.is_alive()  # the only slot is taken
+
+    pool.release(first)  # max_pages reached: quit, not given back
+    waiter.join(5)
+
+    assert not waiter.is_alive()
+    assert first.quit_called
+    assert acquired == [fake_drivers[1]]
+    pool.release(acquired[0])
+    pool.close()
+
+
+def test_waiter_fails_when_pool_is_closed(fake_drivers):
+    pool = scrape_images.DriverPool(1)
+    pool.acquire()
+    errors = []
+
+    def wait_for_driver():
+        try:
+            pool.acquire()
+        except RuntimeError as e:
+            errors.append(e)
+
+    waiter = threading.Thread(target=wait_for_driver, daemon=True)
+    waiter.start()
+    waiter.join(0.2)
+    pool.close(quit_borrowed=True)
+    waiter.join(5)
+
+    assert not waiter.is_alive()
+    assert len(errors) == 1
+    assert fake_drivers[0].quit_called
+
+
+def test_acquire_times_out(fake_drivers):
+    pool = scrape_images.DriverPool(1)
+    driver = pool.acquire()
+    with pytest.raises(scrape_images.queue.Empty):
+        pool.acquire(timeout=0.05)
+    pool.release(driver)
+    assert pool.acquire(timeout=0.05) is driver
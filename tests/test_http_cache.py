@@ -0,0 +1,83 @@
+import scrape_images
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", etag=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = {"ETag": etag} if etag else {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        yield self.body
+
+
+class FakeSession:
+    """Serve ``bodies`` by URL with their content as ETag, honouring If-None-Match."""
+
+    def __init__(self, bodies):
+        self.bodies = bodies
+
+    def get(self, url, headers=None, **kwargs):
+        body = self.bodies[url]
+        etag = f'"{body.decode()}"'
+        if (headers or {}).get("If-None-Match") == etag:
+            return FakeResponse(304)
+        return FakeResponse(200, body, etag)
+
+
+def download(session, url, output_dir, cache, index=1):
+    return scrape_images._download_url(url, index, session, output_dir=output_dir, http_cache=cache)
+
+
+def test_not_modified_image_is_not_taken_from_overwritten_file(tmp_path):
+    session = FakeSession({"https://x/x.jpg": b"X1", "https://x/y.jpg": b"Y1"})
+    cache = scrape_images.HttpCache(tmp_path / "cache.json")
+    output_dir = tmp_path / "images"
+    output_dir.mkdir()
+
+    download(session, "https://x/x.jpg", output_dir, cache)
+    download(session, "https://x/y.jpg", output_dir, cache)  # overwrites image_1.jpg
+    result = download(session, "https://x/x.jpg", output_dir, cache)
+
+    assert result.status == "not-modified"
+    assert (output_dir / "image_1.jpg").read_bytes() == b"X1"
+
+
+def test_changed_image_replaces_its_cached_copy(tmp_path):
+    bodies = {"https://x/x.jpg": b"X1"}
+    session = FakeSession(bodies)
+    cache = scrape_images.HttpCache(tmp_path / "cache.json")
+    output_dir = tmp_path / "images"
+    output_dir.mkdir()
+
+    download(session, "https://x/x.jpg", output_dir, cache)
+    bodies["https://x/x.jpg"] = b"X2"
+    result = download(session, "https://x/x.jpg", output_dir, cache)
+
+    assert result.status == "downloaded"
+    copies = [path.read_bytes() for path in cache.blobs.root.rglob("*.jpg")]
+    assert copies == [b"X2"]
+
+
+def test_resized_copy_is_downloaded_again(tmp_path):
+    session = FakeSession({"https://x/x.jpg": b"X1"})
+    cache = scrape_images.HttpCache(tmp_path / "cache.json")
+    output_dir = tmp_path / "images"
+    output_dir.mkdir()
+
+    download(session, "https://x/x.jpg", output_dir, cache)
+    cache.cached_path("https://x/x.jpg").write_bytes(b"truncated")
+    (output_dir / "image_1.jpg").unlink()
+    result = download(session, "https://x/x.jpg", output_dir, cache)
+
+    assert result.status == "downloaded"
+    assert (output_dir / "image_1.jpg").read_bytes() == b"X1"
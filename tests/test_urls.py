@@ -0,0 +1,61 @@
+import scrape_images
+
+
+def test_dedupe_keeps_content_selecting_parameters():
+    urls = [
+        "https://cdn.example.com/render?id=1&t=thumb",
+        "https://cdn.example.com/render?id=1&t=full",
+    ]
+    assert scrape_images.dedupe_image_urls(urls) == urls
+
+
+def test_dedupe_collapses_cache_busting_variants():
+    urls = [
+        "https://cdn.example.com/a.jpg?v=1",
+        "https://cdn.example.com/a.jpg?v=2",
+    ]
+    assert scrape_images.dedupe_image_urls(urls) == ["https://cdn.example.com/a.jpg?v=1"]
+
+
+def test_dedupe_keeps_largest_size_variant():
+    urls = [
+        "//cdn.shopify.com/files/a_800x.jpg",
+        None,
+        "https://cdn.shopify.com/files/a_1600x.jpg",
+    ]
+    assert scrape_images.dedupe_image_urls(urls) == [
+        "https://cdn.shopify.com/files/a_1600x.jpg",
+        None,
+    ]
+
+
+def test_product_dir_name_tells_variants_and_shops_apart():
+    names = {
+        scrape_images.product_dir_name(url)
+        for url in (
+            "https://a.com/products/foo?variant=1",
+            "https://a.com/products/foo?variant=2",
+            "https://b.com/products/foo",
+        )
+    }
+    assert len(names) == 3
+    assert all("_foo_" in name for name in names)
+
+
+def test_product_dir_name_ignores_fragment():
+    assert scrape_images.product_dir_name(
+        "https://a.com/products/foo#reviews"
+    ) == scrape_images.product_dir_name("https://a.com/products/foo")
+
+
+def test_data_src_used_when_src_is_a_placeholder():
+    attributes = {
+        "src": "data:image/gif;base64,R0lGODlhAQABAAAAACw=",
+        "data-src": "https://cdn.example.com/a.jpg",
+    }
+    assert scrape_images._url_from_attributes(attributes.get, 1) == "https://cdn.example.com/a.jpg"
+
+
+def test_only_placeholders_give_no_url():
+    attributes = {"src": "data:image/gif;base64,R0lGODlhAQABAAAAACw=", "srcset": " "}
+    assert scrape_images._url_from_attributes(attributes.get, 1) is None